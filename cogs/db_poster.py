@@ -1,13 +1,43 @@
 import os
 import discord
 import asyncio
+import gzip
+import io
 import logging
+import shutil
+import sqlite3
+import tempfile
 from discord.ext import commands, tasks
 from lib.bot import VNClubBot
+from lib.rest_retry import call_with_backoff
 
 _log = logging.getLogger(__name__)
 
 
+def _snapshot_database(db_path: str) -> io.BytesIO:
+    """Return a gzipped, transactionally consistent copy of the live DB.
+
+    Blocking — call via ``asyncio.to_thread``. ``VACUUM INTO`` takes an
+    online snapshot, so the upload never reads the live file mid-write,
+    and gzip typically shrinks a SQLite file several-fold, which keeps the
+    upload well under Discord's attachment limit.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, "snapshot.sqlite3")
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("VACUUM INTO ?", (snapshot_path,))
+        finally:
+            conn.close()
+        buf = io.BytesIO()
+        with open(snapshot_path, "rb") as src, gzip.GzipFile(
+            fileobj=buf, mode="wb"
+        ) as gz:
+            shutil.copyfileobj(src, gz)
+    buf.seek(0)
+    return buf
+
+
 class DatabasePoster(commands.Cog):
     def __init__(self, bot: VNClubBot):
         self.bot = bot
@@ -44,10 +74,9 @@ class DatabasePoster(commands.Cog):
                 _log.error(f"Could not find channel with ID {self.target_channel_id}")
                 return False
 
-            # Create a Discord file from the database
-            db_file = discord.File(
-                self.bot.path_to_db, filename="database_backup.sqlite3"
-            )
+            # Snapshot + compress in a worker thread so a multi-MB database
+            # doesn't stall the event loop while it's read.
+            snapshot = await asyncio.to_thread(_snapshot_database, self.bot.path_to_db)
 
             # Send the file with a timestamp
             embed = discord.Embed(
@@ -56,7 +85,14 @@ class DatabasePoster(commands.Cog):
                 color=discord.Color.green() if backup_type == "Startup" else discord.Color.blue(),
             )
 
-            await channel.send(embed=embed, file=db_file)
+            def _send():
+                # Fresh File per attempt: an earlier attempt leaves the
+                # buffer at EOF.
+                snapshot.seek(0)
+                db_file = discord.File(snapshot, filename="database_backup.sqlite3.gz")
+                return channel.send(embed=embed, file=db_file)
+
+            await call_with_backoff(_send, what="database backup post")
             _log.info(
                 f"Successfully posted {backup_type.lower()} database backup to channel {self.target_channel_id}"
             )
@@ -76,9 +112,15 @@ class DatabasePoster(commands.Cog):
     @tasks.loop(hours=6)
     async def post_database(self):
         """Post the database file to the target channel every 6 hours."""
-        await asyncio.sleep(1200)
         await self.send_backup("Scheduled")
 
+    @post_database.before_loop
+    async def _before_post_database(self):
+        # One-time offset so the first scheduled post doesn't land right on
+        # top of the Startup backup from on_ready. Runs once, not per tick.
+        await self.bot.wait_until_ready()
+        await asyncio.sleep(1200)
+
 
 async def setup(bot: VNClubBot):
     await bot.add_cog(DatabasePoster(bot))
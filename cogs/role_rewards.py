@@ -1,9 +1,11 @@
 from lib.bot import VNClubBot
+from lib.rest_retry import call_with_backoff
 import discord
 from discord.ext import commands
 from discord.ext import tasks
 import logging
 import asyncio
+import bisect
 
 _log = logging.getLogger(__name__)
 
@@ -20,12 +22,31 @@ REWARD_STRUCTURE = {
     },
 }
 
+# REWARD_STRUCTURE is a deployment constant, so derive the per-guild views
+# the reward loop needs once at import instead of per member per tick:
+# ascending thresholds with their role ids in matching positions (so the
+# earned tier is one bisect away), and the set of reward role ids.
+_THRESH_KEYS: dict[int, list[int]] = {
+    guild_id: sorted(tiers)
+    for guild_id, tiers in REWARD_STRUCTURE.items()
+}
+_THRESH_ROLES: dict[int, list[int]] = {
+    guild_id: [tiers[k] for k in sorted(tiers)]
+    for guild_id, tiers in REWARD_STRUCTURE.items()
+}
+_GUILD_ROLE_IDS: dict[int, frozenset[int]] = {
+    guild_id: frozenset(tiers.values())
+    for guild_id, tiers in REWARD_STRUCTURE.items()
+}
+
+# user_points_totals is maintained by triggers on reading_logs (see
+# DatabaseQueries.CREATE_USER_POINTS_TOTALS), so this is one row per user
+# rather than a GROUP BY over every log on each tick.
 TOTAL_USER_POINTS_QUERY = """
 SELECT
   user_id,
-  SUM(points) AS total_points
-FROM reading_logs
-GROUP BY user_id;
+  total_points
+FROM user_points_totals;
 """
 
 
@@ -35,42 +56,81 @@ GROUP BY user_id;
 _missing_roles_warned: set[int] = set()
 
 
-async def determine_correct_role(
+def determine_correct_role(
     member: discord.Member, total_points: int
 ) -> discord.Role | None:
     """Get the highest role that the member qualifies for based on their total points."""
-    for points_threshold, role_id in sorted(
-        REWARD_STRUCTURE[member.guild.id].items(), reverse=True
-    ):
-        if total_points >= points_threshold:
-            role = member.guild.get_role(role_id)
-            if role is None:
-                if role_id not in _missing_roles_warned:
-                    _log.warning(
-                        "role_reward: configured role_id=%s not found in guild=%s "
-                        "(deleted/renamed?); users at this threshold will be skipped",
-                        role_id, member.guild.id,
-                    )
-                    _missing_roles_warned.add(role_id)
-                continue
-            _missing_roles_warned.discard(role_id)
-            return role
+    guild_id = member.guild.id
+    role_ids = _THRESH_ROLES[guild_id]
+    # Highest earned tier first, then step down past any deleted roles.
+    for idx in range(bisect.bisect_right(_THRESH_KEYS[guild_id], total_points) - 1, -1, -1):
+        role_id = role_ids[idx]
+        role = member.guild.get_role(role_id)
+        if role is None:
+            if role_id not in _missing_roles_warned:
+                _log.warning(
+                    "role_reward: configured role_id=%s not found in guild=%s "
+                    "(deleted/renamed?); users at this threshold will be skipped",
+                    role_id, guild_id,
+                )
+                _missing_roles_warned.add(role_id)
+            continue
+        _missing_roles_warned.discard(role_id)
+        return role
     return None
 
 
-async def remove_other_roles(member: discord.Member, role_to_keep: discord.Role):
-    """Remove all roles from the member except the specified role."""
-    roles_to_remove = [
+def _roles_to_remove(
+    member: discord.Member, role_to_keep: discord.Role
+) -> list[discord.Role]:
+    """Reward roles the member holds other than ``role_to_keep``."""
+    reward_role_ids = _GUILD_ROLE_IDS[member.guild.id]
+    return [
         role
         for role in member.roles
-        if role != role_to_keep
-        and role.id in REWARD_STRUCTURE[member.guild.id].values()
+        if role != role_to_keep and role.id in reward_role_ids
     ]
-    if roles_to_remove:
-        _log.info(
-            f"Removing roles {', '.join(role.name for role in roles_to_remove)} from {member.display_name}."
-        )
-        await member.remove_roles(*roles_to_remove, reason="Updating role rewards")
+
+
+def _tier_role_id(guild_id: int, total_points: int) -> int | None:
+    """Configured role id for the highest tier ``total_points`` reaches,
+    ignoring whether the role still exists (see determine_correct_role)."""
+    idx = bisect.bisect_right(_THRESH_KEYS[guild_id], total_points) - 1
+    return _THRESH_ROLES[guild_id][idx] if idx >= 0 else None
+
+
+def _target_roles(
+    member: discord.Member, role_to_keep: discord.Role
+) -> list[discord.Role]:
+    """The member's full role list after a reward update: every non-reward
+    role they already hold plus ``role_to_keep``. @everyone is implicit and
+    must not be sent in a member edit."""
+    reward_role_ids = _GUILD_ROLE_IDS[member.guild.id]
+    roles = [
+        role
+        for role in member.roles
+        if not role.is_default() and role.id not in reward_role_ids
+    ]
+    roles.append(role_to_keep)
+    return roles
+
+
+def _crossed_tier(old_points: int | None, new_points: int) -> bool:
+    """True if moving from ``old_points`` to ``new_points`` changes the
+    earned tier in any configured guild. ``None`` (never seen) counts."""
+    if old_points is None:
+        return True
+    return any(
+        _tier_role_id(guild_id, old_points) != _tier_role_id(guild_id, new_points)
+        for guild_id in REWARD_STRUCTURE
+    )
+
+
+# Every Nth tick walks every user with points rather than just the ones
+# who crossed a tier since the last tick. Catches members who joined a
+# reward guild after earning their points, manual role edits, and users
+# whose previous edit failed. 12 × 5 minutes = hourly.
+_FULL_SWEEP_EVERY_TICKS = 12
 
 
 class RoleRewards(commands.Cog):
@@ -81,6 +141,10 @@ class RoleRewards(commands.Cog):
         # constant; if a guild isn't reachable on startup, repeating the
         # warning every 5 minutes just buries real signal in noise.
         self._missing_guilds_warned: set[int] = set()
+        # user_id -> total_points as of the previous tick, so steady-state
+        # ticks only evaluate users whose points moved them across a tier.
+        self._last_totals: dict[int, int] = {}
+        self._ticks_since_full_sweep = 0
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -89,13 +153,30 @@ class RoleRewards(commands.Cog):
 
     @tasks.loop(minutes=5)
     async def check_rewards(self):
-        await asyncio.sleep(30)
         result = await self.bot.GET(TOTAL_USER_POINTS_QUERY)
         if not result:
             _log.warning("No user points found, skipping rewards check.")
             return
 
-        data = {row[0]: row[1] for row in result}  # user_id: total_points
+        totals = {row[0]: row[1] for row in result}  # user_id: total_points
+
+        full_sweep = (
+            not self._last_totals
+            or self._ticks_since_full_sweep >= _FULL_SWEEP_EVERY_TICKS
+        )
+        if full_sweep:
+            data = totals
+            self._ticks_since_full_sweep = 0
+        else:
+            data = {
+                user_id: points
+                for user_id, points in totals.items()
+                if _crossed_tier(self._last_totals.get(user_id), points)
+            }
+            self._ticks_since_full_sweep += 1
+        self._last_totals = totals
+        if not data:
+            return
 
         try:
             for guild_id in REWARD_STRUCTURE:
@@ -111,6 +192,7 @@ class RoleRewards(commands.Cog):
                 # Re-arm the warning if the guild becomes reachable again
                 # (e.g. after a reconnect or re-invite mid-run).
                 self._missing_guilds_warned.discard(guild_id)
+                reward_role_ids = _GUILD_ROLE_IDS[guild_id]
 
                 for user_id in data:
                     user = guild.get_member(user_id)
@@ -118,8 +200,16 @@ class RoleRewards(commands.Cog):
                         continue
 
                     total_points = data[user_id]
-                    role_to_keep = await determine_correct_role(user, total_points)
-                    if role_to_keep and role_to_keep not in user.roles:
+                    # Steady state for almost every member: they already
+                    # hold exactly the tier their points earn and nothing
+                    # else from the ladder. Settle that with one set
+                    # comparison before doing any role resolution.
+                    held_reward_ids = {role.id for role in user.roles} & reward_role_ids
+                    if held_reward_ids == {_tier_role_id(guild_id, total_points)}:
+                        continue
+
+                    role_to_keep = determine_correct_role(user, total_points)
+                    if role_to_keep and held_reward_ids != {role_to_keep.id}:
                         _log.info(
                             "role_reward: assigning role=%s (id=%s) to user=%s (id=%s) guild=%s points=%s",
                             role_to_keep.name, role_to_keep.id,
@@ -130,9 +220,23 @@ class RoleRewards(commands.Cog):
                         # the loop. The outer except below still catches
                         # anything raised by the bot.GET or the per-guild
                         # bookkeeping, which is what "task wedged" looks like.
+                        #
+                        # One member edit swaps the reward role in and any
+                        # stale tier out in a single PATCH, instead of a
+                        # remove_roles + add_roles pair.
                         try:
-                            await remove_other_roles(user, role_to_keep)
-                            await user.add_roles(role_to_keep, reason="Role reward update")
+                            stale_roles = _roles_to_remove(user, role_to_keep)
+                            if stale_roles:
+                                _log.info(
+                                    f"Removing roles {', '.join(role.name for role in stale_roles)} from {user.display_name}."
+                                )
+                            target_roles = _target_roles(user, role_to_keep)
+                            await call_with_backoff(
+                                lambda: user.edit(
+                                    roles=target_roles, reason="Role reward update",
+                                ),
+                                what=f"role_reward edit for user={user.id}",
+                            )
                         except discord.Forbidden:
                             _log.exception(
                                 "role_reward: forbidden assigning role=%s to user=%s "
@@ -148,6 +252,13 @@ class RoleRewards(commands.Cog):
         except Exception:
             _log.exception("Error in check_rewards task")
 
+    @check_rewards.before_loop
+    async def _before_check_rewards(self):
+        # Give the member cache a moment to fill after on_ready before the
+        # first scan. One-time; later ticks run on the plain 5-minute cadence.
+        await self.bot.wait_until_ready()
+        await asyncio.sleep(30)
+
 
 async def setup(bot: VNClubBot):
     await bot.add_cog(RoleRewards(bot))
@@ -1,6 +1,8 @@
 import asyncio
 import discord
 import logging
+import time
+from collections import OrderedDict
 from lib.bot import VNClubBot
 from discord.ext import commands
 
@@ -27,24 +29,49 @@ VALUES (?, ?, ?) ON CONFLICT(discord_user_id) DO UPDATE SET
 FETCH_USER_QUERY = """
 SELECT user_name FROM users WHERE discord_user_id = ?;"""
 
+FETCH_USERS_QUERY = """
+SELECT discord_user_id, user_name FROM users WHERE discord_user_id IN ({placeholders});"""
+# Ids per IN (...) query; stays under SQLite's host-parameter limit.
+_FETCH_USERS_CHUNK = 500
+
 FETCH_LOCK = asyncio.Lock()
 
+# Resolved display names, {user_id: (monotonic_ts, name)} in LRU order.
+# Leaderboards, /ratings and the standings embeds resolve the same ids over
+# and over; a hit skips the users-table upsert (a serialized write) or
+# read. The TTL bounds how stale a renamed user's name can get.
+_USERNAME_TTL_SECONDS = 300
+_USERNAME_CACHE_CAP = 10_000
+_username_cache: "OrderedDict[int, tuple[float, str]]" = OrderedDict()
+
+
+def _remember_username(user_id: int, name: str) -> str:
+    _username_cache[user_id] = (time.monotonic(), name)
+    _username_cache.move_to_end(user_id)
+    while len(_username_cache) > _USERNAME_CACHE_CAP:
+        _username_cache.popitem(last=False)
+    return name
+
 
 async def get_username_db(bot: VNClubBot, user_id: int) -> str:
+    cached = _username_cache.get(user_id)
+    if cached is not None and (time.monotonic() - cached[0]) < _USERNAME_TTL_SECONDS:
+        _username_cache.move_to_end(user_id)
+        return cached[1]
     user = bot.get_user(user_id)
     if user:
         await bot.RUN(INSERT_USER_QUERY, (user.id, user.display_name, user.name))
-        return user.display_name
+        return _remember_username(user_id, user.display_name)
     user_name = await bot.GET_ONE(FETCH_USER_QUERY, (user_id,))
     if user_name:
-        return user_name[0]
+        return _remember_username(user_id, user_name[0])
     async with FETCH_LOCK:
         await asyncio.sleep(1)  # Rate limit protection
         try:
             user = await bot.fetch_user(user_id)
             if user:
                 await bot.RUN(INSERT_USER_QUERY, (user.id, user.display_name, user.name))
-                return user.display_name
+                return _remember_username(user_id, user.display_name)
             else:
                 return "Unknown User"
         except discord.NotFound:
@@ -55,6 +82,50 @@ async def get_username_db(bot: VNClubBot, user_id: int) -> str:
             return "Unknown User"
 
 
+async def get_usernames_db(bot: VNClubBot, user_ids) -> dict[int, str]:
+    """Bulk form of ``get_username_db`` for leaderboard-style lists.
+
+    Same sources in the same order, batched: cached names first, then the
+    gateway cache (upserted in one transaction), then one ``IN (...)``
+    read of the users table. Only ids missing from all three fall back to
+    ``get_username_db``'s rate-limited Discord fetch.
+    """
+    names: dict[int, str] = {}
+    upserts = []
+    unresolved = []
+    now = time.monotonic()
+    for user_id in dict.fromkeys(user_ids):
+        cached = _username_cache.get(user_id)
+        if cached is not None and (now - cached[0]) < _USERNAME_TTL_SECONDS:
+            _username_cache.move_to_end(user_id)
+            names[user_id] = cached[1]
+            continue
+        user = bot.get_user(user_id)
+        if user:
+            upserts.append((INSERT_USER_QUERY, (user.id, user.display_name, user.name)))
+            names[user_id] = _remember_username(user_id, user.display_name)
+        else:
+            unresolved.append(user_id)
+    if upserts:
+        await bot.RUN_TRANSACTION(upserts)
+
+    for start in range(0, len(unresolved), _FETCH_USERS_CHUNK):
+        chunk = unresolved[start:start + _FETCH_USERS_CHUNK]
+        rows = await bot.GET(
+            FETCH_USERS_QUERY.format(placeholders=",".join("?" * len(chunk))),
+            tuple(chunk),
+        )
+        for user_id, user_name in rows:
+            if user_name:
+                names[user_id] = _remember_username(user_id, user_name)
+
+    missing = [uid for uid in unresolved if uid not in names]
+    if missing:
+        fetched = await asyncio.gather(*(get_username_db(bot, uid) for uid in missing))
+        names.update(zip(missing, fetched))
+    return names
+
+
 async def cache_user(bot: VNClubBot, user) -> None:
     """Upsert a user's display_name and unique handle into the local
     `users` table. Call from write-time paths (vote, nominate) so the
@@ -66,6 +137,7 @@ async def cache_user(bot: VNClubBot, user) -> None:
         return
     try:
         await bot.RUN(INSERT_USER_QUERY, (user.id, user.display_name, user.name))
+        _remember_username(user.id, user.display_name)
     except Exception:  # noqa: BLE001
         _log.exception("cache_user failed for user_id=%s", getattr(user, "id", "?"))
 
@@ -74,7 +74,11 @@ from lib.utils import (
 from lib.theme_service import gather_theme_attributes
 from lib.themes import evaluate_theme, validate_rules, RULES_SCHEMA_VERSION
 from lib.vndb_api import from_vndb_id
-from lib.autocomplete import vn_autocomplete, month_picker_future_autocomplete
+from lib.autocomplete import (
+    vn_autocomplete,
+    month_picker_future_autocomplete,
+    forget_pool_autocomplete,
+)
 from cogs.username_fetcher import cache_user
 
 _log = logging.getLogger(__name__)
@@ -1482,7 +1486,7 @@ async def _build_panel_text(bot, state: dict) -> str:
     return "\n".join(lines)
 
 
-async def _build_settings_text(state: dict) -> str:
+def _build_settings_text(state: dict) -> str:
     role_id = state["default_voting_role_id"]
     role_part = f"<@&{role_id}>" if role_id else "_not set_"
     ui_part = state["default_vote_ui"] or "dropdown"
@@ -1675,7 +1679,7 @@ class _SettingsButton(discord.ui.Button):
 
     async def callback(self, interaction: discord.Interaction):
         settings_view = VotingSettingsPanelView(self.panel)
-        content = await _build_settings_text(self.panel.state)
+        content = _build_settings_text(self.panel.state)
         await interaction.response.edit_message(content=content, view=settings_view)
 
 
@@ -2051,7 +2055,7 @@ class VotingSettingsPanelView(discord.ui.View):
         self.add_item(_ClearRoleButton(self))
         self.add_item(_DefaultVoteUiSelect(self))
         self.add_item(_BackToPanelButton(self))
-        content = await _build_settings_text(self.state)
+        content = _build_settings_text(self.state)
         if interaction.response.is_done():
             await interaction.edit_original_response(content=content, view=self)
         else:
@@ -2956,6 +2960,7 @@ class VNCycleCog(commands.Cog):
                  cycle_id),
             )
             await db.commit()
+        forget_pool_autocomplete()
 
         # Schedule the exact-time close. Polling loop is the recovery
         # net; this gives sub-second precision on the happy path.
@@ -3939,13 +3944,13 @@ class VNCycleCog(commands.Cog):
                 # cycle_id stays NULL — nominations are unattached until
                 # Open voting sweeps them onto a cycle. Points default to
                 # DEFAULT_MONTHLY_POINTS; admin can edit via /manage_pool.
-                pool_id = await self.bot.RUN_RETURNING_ID(
+                inserted = await self.bot.RUN_RETURNING(
                     DatabaseQueries.INSERT_NOMINATION_AS_PICK,
                     (vndb_id, interaction.guild.id, start_month, end_month,
                      DEFAULT_MONTHLY_POINTS, None,
                      interaction.user.id, display_title),
                 )
-                if not pool_id:
+                if not inserted:
                     # Race: a concurrent /nominate landed first (the same user
                     # for the same period, or a different user nominating this
                     # same VN) and a partial unique index made this INSERT a
@@ -3959,8 +3964,13 @@ class VNCycleCog(commands.Cog):
                         "to swap your pick."
                     )
                     return
+                pool_id = inserted[0][0]
                 await cache_user(self.bot, interaction.user)
                 update_mode = False
+            # Both branches changed which VNs sit in the pool; drop the
+            # cached rows behind vn_pool_autocomplete so they show up now
+            # rather than after the TTL.
+            forget_pool_autocomplete()
 
             jiten_data = None
             try:
@@ -4021,28 +4031,40 @@ class VNCycleCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         try:
             guild_id = interaction.guild.id
-            actives = []
-            for kind in ("monthly", "seasonal"):
-                cycle = await _active_cycle(self.bot, guild_id, kind)
-                if cycle and cycle[CYCLE_PHASE] == "voting":
-                    actives.append(cycle)
+            cycles = await asyncio.gather(*(
+                _active_cycle(self.bot, guild_id, kind)
+                for kind in ("monthly", "seasonal")
+            ))
+            actives = [
+                cycle for cycle in cycles
+                if cycle and cycle[CYCLE_PHASE] == "voting"
+            ]
             if not actives:
                 await interaction.followup.send(
                     "❌ No active voting in this server.", ephemeral=True,
                 )
                 return
-            for cycle in actives:
-                nominees = await self.bot.GET(
-                    DatabaseQueries.GET_CYCLE_NOMINEES, (cycle[CYCLE_ID],),
+
+            async def _prompt(cycle):
+                nominees, tally = await asyncio.gather(
+                    self.bot.GET(DatabaseQueries.GET_CYCLE_NOMINEES, (cycle[CYCLE_ID],)),
+                    self.bot.GET(DatabaseQueries.TALLY_VOTES, (cycle[CYCLE_ID],)),
                 )
                 if not nominees:
-                    continue
-                tally = await self.bot.GET(
-                    DatabaseQueries.TALLY_VOTES, (cycle[CYCLE_ID],),
-                )
+                    return None
                 embed = await _render_vote_prompt(
                     self.bot, cycle, nominees, tally,
                 )
+                return cycle, nominees, embed
+
+            # Reads and renders for both cycles overlap; the sends stay
+            # sequential (and in monthly → seasonal order) because each
+            # message carries its own VoteView.
+            prompts = await asyncio.gather(*(_prompt(cycle) for cycle in actives))
+            for prompt in prompts:
+                if prompt is None:
+                    continue
+                cycle, nominees, embed = prompt
                 view = VoteView(
                     cycle_id=cycle[CYCLE_ID],
                     nominees=list(nominees),
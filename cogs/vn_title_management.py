@@ -1,14 +1,14 @@
-import aiosqlite
+import asyncio
 import discord
 import discord.app_commands as app_commands
 import io
 import logging
 from collections import OrderedDict
+from datetime import datetime
 from typing import Literal, Optional
 from discord.ext import commands
 from lib.bot import VNClubBot
-from lib.vndb_api import from_vndb_id, fetch_vndb_extras, VN_Entry, CREATE_VNDB_CACHE_TABLE
-from lib.pagination import BasePaginationView
+from lib.vndb_api import from_vndb_id, from_vndb_ids, fetch_vndb_extras, VN_Entry, CREATE_VNDB_CACHE_TABLE
 from lib.utils import (
     ANIME_SEASONS,
     AUTHORIZED_USER_IDS,
@@ -34,7 +34,7 @@ from lib.utils import (
 )
 from lib.embeds import EmbedBuilder, build_vn_links_view
 from lib.autocomplete import (
-    vn_autocomplete, vn_pool_autocomplete,
+    vn_autocomplete, vn_pool_autocomplete, forget_pool_autocomplete,
     month_picker_autocomplete, month_int_autocomplete, year_autocomplete,
     bot_guilds_autocomplete,
 )
@@ -193,6 +193,11 @@ _PICK_KIND_EMOJI = {
     "special":  "✨",
 }
 
+# Max /monthly and /seasonal pages rendered at once. Each in-flight render
+# holds a decoded cover plus a 2x banner canvas and makes its own jiten /
+# VNDB requests, so keep this small.
+_BANNER_RENDER_CONCURRENCY = 3
+
 # Per-page description budget for /pool. Discord caps embed descriptions
 # at 4096 chars; leave headroom for the meta line and section headers we
 # prepend at embed-build time.
@@ -200,6 +205,14 @@ _POOL_DESC_BUDGET = 3900
 # Defensive cap so one pathologically long row can't render past 4096 by itself.
 _POOL_ROW_HARD_CAP = 1000
 
+# One /pool row. ``tail`` is the points badge for picks or the nominator
+# mention for nominations; ``period`` and ``server`` are pre-rendered
+# segments (empty when redundant with the view header / scope).
+_POOL_LINE_TEMPLATE = (
+    "{emoji} `[{tag}]` **#{rid}** [{title}](https://vndb.org/{vndb_id}) "
+    "`{vndb_id}`{period} · {tail}{server}"
+)
+
 
 def _nomination_tag(phase: str, winner_flag: int) -> tuple[str, str]:
     """Pick the (emoji, label) for a nomination row.
@@ -240,87 +253,19 @@ def _pool_row_tag(row) -> tuple[str, str]:
     return _nomination_tag(phase or "nominating", winner_flag)
 
 
-# ==================== VIEW CLASSES ====================
-
-
-class VNListView(BasePaginationView):
-    """Paginated view for VN list with navigation buttons"""
+async def _fetch_vn_entries(bot, vndb_ids: list[str]) -> list[Optional[VN_Entry]]:
+    """Resolve ``vndb_ids`` via one bulk cache query, preserving input order.
 
-    def __init__(self, vn_data, title, per_page=10, show_server=False, bot=None):
-        # show_server + bot are set when /pool is invoked with all_servers:true
-        # so each entry can be tagged with its source server.
-        self.show_server = show_server
-        self._bot = bot
-        super().__init__(vn_data, title, per_page)
-
-    def create_embed(self):
-        """Create an embed for the current page"""
-        from lib.utils import create_base_embed, add_pagination_footer, get_current_month
-
-        embed = create_base_embed(
-            title=self.title,
-            color=discord.Color.blurple(),
-            author_name="Visual Novel Club"
-        )
-
-        page_data = self.get_page_data()
-        current_month = get_current_month()
-
-        description_strings = []
-        for entry in page_data:
-            # entry shape: (pool_id, vndb_id, guild_id, start_month, end_month,
-            #               is_monthly_points, status, vn_info)
-            pool_id, vndb_id, guild_id, start_month, end_month, is_monthly_points, status, vn_info = entry
-            if not vn_info:
-                continue
-            link = f"https://vndb.org/{vndb_id}"
-            non_monthly_points = max(1, int(is_monthly_points * 0.6))  # Estimate non-monthly points
-
-            # Check if this entry is in its active window right now
-            is_active = start_month <= current_month <= end_month
-
-            # Create clean date display
-            if start_month == end_month:
-                date_display = start_month
-            else:
-                date_display = f"{start_month} to {end_month}"
+    Ids that fail to resolve come back as None, the same shape as a
+    ``from_vndb_id`` miss, so callers keep their skip-on-None handling.
+    """
+    by_id = await from_vndb_ids(bot, vndb_ids)
+    return [
+        by_id.get(v if v.startswith("v") else f"v{v}") for v in vndb_ids
+    ]
 
-            # "Current X" label reflects the entry's status when active.
-            kind_label = (status or "monthly").capitalize()
-            if is_active:
-                indicator = f"🔥 **{date_display}** *(Current {kind_label})*"
-            else:
-                indicator = f"➤ **{date_display}**"
-
-            # Tags: status always shown; server only in all_servers mode.
-            kind_tag = f" *[{status or 'monthly'}]*"
-            server_tag = ""
-            if self.show_server:
-                if guild_id is None:
-                    name = "Global (legacy)"
-                elif self._bot is not None:
-                    g = self._bot.get_guild(guild_id)
-                    name = g.name if g else f"Server {guild_id}"
-                else:
-                    name = f"Server {guild_id}"
-                server_tag = f" *[{name}]*"
-
-            # Prioritize Japanese title, fallback to English title, or generic text if both are empty
-            display_title = vn_info.title_ja or vn_info.title_en or "View on VNDB"
-
-            # Pool ID is the first thing on the entry line so admins can use
-            # it directly with /manage_pool action:remove.
-            description_string = (
-                f"{indicator}{kind_tag}{server_tag}\n"
-                f"└ `#{pool_id}` [{display_title}]({link}) `{vndb_id}` "
-                f"• **{is_monthly_points}**点 *(active)* • **{non_monthly_points}**点 *(regular)*"
-            )
-            description_strings.append(description_string)
-        
-        embed.description = "\n\n".join(description_strings) if description_strings else "No VNs found on this page."
-        add_pagination_footer(embed, self.current_page, self.max_pages, len(self.data))
 
-        return embed
+# ==================== VIEW CLASSES ====================
 
 
 class PoolNavigationView(discord.ui.View):
@@ -444,7 +389,6 @@ class PoolNavigationView(discord.ui.View):
     async def today(
         self, interaction: discord.Interaction, _button: discord.ui.Button,
     ):
-        from datetime import datetime
         if self.view_mode == "seasonal":
             cur_season, cur_year = current_anime_season()
             self.month = int(season_to_months(cur_season, cur_year)[0].split("-")[1])
@@ -647,7 +591,7 @@ class PoolBannerPaginator(discord.ui.View):
 
 async def get_vn_month(interaction: discord.Interaction, month: str | None) -> str:
     try:
-        return await validate_month_input(interaction, month)
+        return validate_month_input(interaction, month)
     except ValidationError as e:
         await interaction.followup.send(e.user_message)
         return None
@@ -684,44 +628,6 @@ def _parse_pool_id(raw: str | int | None) -> int:
     return n
 
 
-async def check_if_already_exists(
-    interaction: discord.Interaction, vndb_id: str
-) -> bool:
-    guild_id = interaction.guild.id if interaction.guild else None
-    if guild_id is not None:
-        result = await interaction.client.GET_ONE(
-            DatabaseQueries.GET_VN_TITLE_FOR_GUILD, (vndb_id, guild_id)
-        )
-    else:
-        result = await interaction.client.GET_ONE(
-            DatabaseQueries.GET_VN_TITLE, (vndb_id,)
-        )
-    if result:
-        await interaction.followup.send(
-            f"VN title with ID `{vndb_id}` already exists for this server."
-        )
-        return True
-    return False
-
-
-async def check_if_not_exists(interaction: discord.Interaction, vndb_id: str) -> bool:
-    guild_id = interaction.guild.id if interaction.guild else None
-    if guild_id is not None:
-        result = await interaction.client.GET_ONE(
-            DatabaseQueries.GET_VN_TITLE_FOR_GUILD, (vndb_id, guild_id)
-        )
-    else:
-        result = await interaction.client.GET_ONE(
-            DatabaseQueries.GET_VN_TITLE, (vndb_id,)
-        )
-    if not result:
-        await interaction.followup.send(
-            f"VN title with ID `{vndb_id}` does not exist for this server."
-        )
-        return True
-    return False
-
-
 async def get_vndb_info(
     interaction: discord.Interaction, vndb_id: str
 ) -> Optional[VN_Entry]:
@@ -759,10 +665,34 @@ class VNTitleManagement(commands.Cog):
         # two users hitting the same season concurrently, both reuse the
         # render. See _get_or_build_season_overview_payload.
         self._season_overview_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._prewarm_task: Optional[asyncio.Task] = None
 
     async def cog_load(self):
         await self.bot.RUN(DatabaseQueries.CREATE_VN_TITLES_TABLE)
         await self.bot.RUN(CREATE_VNDB_CACHE_TABLE)
+        # Background so a slow VNDB can't hold up cog registration.
+        self._prewarm_task = asyncio.create_task(self._prewarm_vn_entries())
+
+    async def cog_unload(self):
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+
+    async def _prewarm_vn_entries(self) -> None:
+        """Resolve every VN on a current/upcoming pool entry into the
+        in-process VN_Entry cache, so the first /monthly, /seasonal or
+        /season_overview after a restart doesn't pay for them. Misses are
+        fetched through from_vndb_ids' bounded fan-out. Best-effort."""
+        try:
+            rows = await self.bot.GET(
+                DatabaseQueries.GET_ACTIVE_POOL_VNDB_IDS, (get_current_month(),),
+            )
+            if rows:
+                warmed = await from_vndb_ids(self.bot, [row[0] for row in rows])
+                _log.info("Prewarmed %d/%d pool VN entries", len(warmed), len(rows))
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # noqa: BLE001
+            _log.exception("pool VN prewarm failed")
 
     POOL_ACTIONS = [
         app_commands.Choice(name="Add a VN to the pool", value="add"),
@@ -1044,13 +974,19 @@ class VNTitleManagement(commands.Cog):
         # Refuse adds that overlap an existing active entry for the same VN +
         # guild. Admins can still add the same VN for non-overlapping periods
         # (the deliberate "two cycles" use case); this just catches the
-        # "re-add after a bad edit, now there are two rows" footgun.
-        existing_overlaps = await self.bot.GET(
-            DatabaseQueries.GET_OVERLAPPING_POOL_ENTRIES,
-            (vn_info.vndb_id, target_guild_id, target_guild_id,
-             end_month, start_month),
+        # "re-add after a bad edit, now there are two rows" footgun. The
+        # overlap check rides along with the INSERT; only a blocked add pays
+        # for the extra SELECT that lists what it collided with.
+        inserted = await self.bot.RUN_RETURNING(
+            DatabaseQueries.ADD_VN_TITLE_FOR_GUILD_IF_NO_OVERLAP,
+            (vn_info.vndb_id, target_guild_id, start_month, end_month, points, status),
         )
-        if existing_overlaps:
+        if not inserted:
+            existing_overlaps = await self.bot.GET(
+                DatabaseQueries.GET_OVERLAPPING_POOL_ENTRIES,
+                (vn_info.vndb_id, target_guild_id, target_guild_id,
+                 end_month, start_month),
+            )
             rows_desc = []
             for row in existing_overlaps:
                 row_id, _vid, _gid, sm, em, st = row
@@ -1063,11 +999,7 @@ class VNTitleManagement(commands.Cog):
                 "Use `/manage_pool action:edit` to modify the existing entry, "
                 "or `action:remove` first if you want to start fresh.",
             )
-
-        new_pool_id = await self.bot.RUN_RETURNING_ID(
-            DatabaseQueries.ADD_VN_TITLE_FOR_GUILD,
-            (vn_info.vndb_id, target_guild_id, start_month, end_month, points, status),
-        )
+        new_pool_id = inserted[0][0]
         self._invalidate_season_overview_cache()
 
         _log.info(f"Added VN to pool ({status}, pool_id={new_pool_id}): {vn_info}")
@@ -1104,44 +1036,41 @@ class VNTitleManagement(commands.Cog):
         # else, including non-numeric input.
         pool_id = _parse_pool_id(title)
 
-        row = await self.bot.GET_ONE(
-            DatabaseQueries.GET_VN_TITLE_BY_ID, (pool_id,)
+        # Delete and scope-check in one statement. The guild filter is
+        # the same rule require_same_guild enforces, so a per-server
+        # admin in guild A can't wipe guild B's entry by knowing its id;
+        # AUTHORIZED_USERS (bot operators) are unscoped.
+        is_operator = interaction.user.id in AUTHORIZED_USER_IDS
+        deleted = await self.bot.RUN_RETURNING(
+            DatabaseQueries.DELETE_VN_TITLE_IN_SCOPE_RETURNING,
+            (pool_id, interaction.guild_id, int(is_operator)),
         )
-        if not row:
-            raise ValidationError(
-                f"No pool entry #{pool_id}",
-                f"No pool entry with ID #{pool_id}.",
-            )
-        # row: (id, vndb_id, guild_id, start_month, end_month, is_monthly_points, status)
-        _id, vndb_id, _gid, start_m, end_m, _pts, status = row
-        # Block cross-guild removes: a per-server admin in guild A
-        # shouldn't be able to wipe guild B's pool entry by knowing the
-        # id. AUTHORIZED_USERS (bot operators) bypass this check.
-        require_same_guild(interaction, _gid, entity_name="pool entry")
-
-        _log.info(
-            f"User {interaction.user.name} removing pool entry #{pool_id} "
-            f"(vndb_id={vndb_id}, status={status}, period={start_m}–{end_m})"
-        )
-
-        # Pass the observed guild_id so the DELETE only hits the row
-        # we read. If a concurrent admin (or an external admin tool with
-        # direct DB access) moved the row's guild between our GET and
-        # this DELETE, the statement no-ops and we tell the admin to
-        # retry rather than silently mutating someone else's data.
-        async with aiosqlite.connect(self.bot.path_to_db) as _db:
-            _cur = await _db.execute(
-                DatabaseQueries.DELETE_VN_TITLE_BY_ID, (pool_id, _gid),
+        if not deleted:
+            # Slow path, only on failure: re-read to give the precise
+            # reason (missing vs. another server's entry vs. a concurrent
+            # write that moved the row out of scope mid-statement).
+            row = await self.bot.GET_ONE(
+                DatabaseQueries.GET_VN_TITLE_BY_ID, (pool_id,)
             )
-            _rowcount = _cur.rowcount
-            await _db.commit()
-        if _rowcount == 0:
+            if not row:
+                raise ValidationError(
+                    f"No pool entry #{pool_id}",
+                    f"No pool entry with ID #{pool_id}.",
+                )
+            require_same_guild(interaction, row[2], entity_name="pool entry")
             raise ValidationError(
                 f"pool entry #{pool_id} moved between read and delete",
                 f"Pool entry **#{pool_id}** changed under us (its server "
                 f"affiliation was modified by another manager or the web "
                 f"console while we were reading it). Re-run the command.",
             )
+        # deleted[0]: (id, vndb_id, guild_id, start_month, end_month, is_monthly_points, status)
+        _id, vndb_id, _gid, start_m, end_m, _pts, status = deleted[0]
+
+        _log.info(
+            f"User {interaction.user.name} removed pool entry #{pool_id} "
+            f"(vndb_id={vndb_id}, status={status}, period={start_m}–{end_m})"
+        )
         self._invalidate_season_overview_cache()
 
         period = start_m if start_m == end_m else f"{start_m}–{end_m}"
@@ -1288,15 +1217,16 @@ class VNTitleManagement(commands.Cog):
         # admin work, they just have to read+write a stable row.
         observed_guild_id = existing[2]  # row's guild_id as we read it
         params.extend([pool_id, observed_guild_id])
+        # RETURNING hands back the post-edit row for the confirmation, so
+        # the write and the re-read share one trip on the bot's connection.
         sql = (
             f"UPDATE vn_titles SET {', '.join(sets)} "
-            f"WHERE id = ? AND guild_id IS ?"
+            f"WHERE id = ? AND guild_id IS ? "
+            f"RETURNING id, vndb_id, guild_id, start_month, end_month, "
+            f"is_monthly_points, status"
         )
-        async with aiosqlite.connect(self.bot.path_to_db) as _db:
-            _cur = await _db.execute(sql, tuple(params))
-            _rowcount = _cur.rowcount
-            await _db.commit()
-        if _rowcount == 0:
+        updated_rows = await self.bot.RUN_RETURNING(sql, tuple(params))
+        if not updated_rows:
             raise ValidationError(
                 f"pool entry #{pool_id} moved between read and edit",
                 f"Pool entry **#{pool_id}** changed under us (its server "
@@ -1310,20 +1240,7 @@ class VNTitleManagement(commands.Cog):
             interaction.user.name, pool_id, ", ".join(applied),
         )
 
-        # Re-fetch the row so the followup reflects the post-edit state.
-        # If guild_id was changed away from this guild, the row may no
-        # longer be visible via the per-guild query — fall back to id-only.
-        updated = await self.bot.GET_ONE(
-            "SELECT id, vndb_id, guild_id, start_month, end_month, "
-            "is_monthly_points, status FROM vn_titles WHERE id = ?",
-            (pool_id,),
-        )
-        if not updated:
-            await interaction.followup.send(
-                f"Pool entry **#{pool_id}** updated.", ephemeral=True
-            )
-            return
-        _id, vndb_id, gid, sm, em, pts, st = updated
+        _id, vndb_id, gid, sm, em, pts, st = updated_rows[0]
         period = sm if sm == em else f"{sm}–{em}"
         gid_str = "NULL (global)" if gid is None else str(gid)
         msg = (
@@ -1361,7 +1278,6 @@ class VNTitleManagement(commands.Cog):
     ):
         await interaction.response.defer()
 
-        from datetime import datetime
         now = datetime.now()
         m = month if month is not None else now.month
         y = year if year is not None else now.year
@@ -1452,7 +1368,7 @@ class VNTitleManagement(commands.Cog):
         embed = discord.Embed(
             title=f"#{rid} · {display_title}",
             description=(
-                await vn_info.get_normalized_description(max_length=600)
+                vn_info.get_normalized_description(max_length=600)
                 if vn_info else "No description available."
             ),
             color=discord.Color.blurple(),
@@ -1587,25 +1503,25 @@ class VNTitleManagement(commands.Cog):
                 (probe_end_month, probe_start_month, guild_id),
             )
 
-        # View-mode lane: period span keeps monthly/seasonal entries
-        # cleanly separated. Single-month rows (start_month == end_month)
-        # belong to monthly view; multi-month rows to seasonal view.
-        # Indices: start_month=3, end_month=4.
-        if view_mode == "seasonal":
-            rows = [r for r in rows if r[3] != r[4]]
+        # One pass buckets every row. View-mode lane: period span keeps
+        # monthly/seasonal entries cleanly separated — single-month rows
+        # (start_month == end_month) belong to monthly view, multi-month
+        # rows to seasonal view. Then the status filter, then the split
+        # into picks vs nominations. Indices: start_month=3, end_month=4,
+        # status=9 (see GET_VN_TITLES_FOR_MONTH).
+        seasonal_lane = view_mode == "seasonal"
+        if filter_value in ("nominations", "monthly", "seasonal", "special"):
+            wanted_status = "nominated" if filter_value == "nominations" else filter_value
         else:
-            rows = [r for r in rows if r[3] == r[4]]
-
-        # Apply filter. Status indices: see GET_VN_TITLES_FOR_MONTH column 9.
-        if filter_value == "nominations":
-            rows = [r for r in rows if r[9] == "nominated"]
-        elif filter_value in ("monthly", "seasonal", "special"):
-            rows = [r for r in rows if r[9] == filter_value]
-        # 'all' → no filter
-
-        # Split into pick rows (status != nominated) and nomination rows.
-        picks = [r for r in rows if r[9] != "nominated"]
-        noms = [r for r in rows if r[9] == "nominated"]
+            wanted_status = None  # 'all' → no filter
+        picks: list = []
+        noms: list = []
+        for r in rows:
+            if (r[3] != r[4]) is not seasonal_lane:
+                continue
+            if wanted_status is not None and r[9] != wanted_status:
+                continue
+            (noms if r[9] == "nominated" else picks).append(r)
 
         scope_label = "All Servers" if all_servers else "This Server"
         view_label = "Seasonal" if view_mode == "seasonal" else "Monthly"
@@ -1633,9 +1549,10 @@ class VNTitleManagement(commands.Cog):
 
         # Build (section_header, lines) tuples in render order. Monthly noms
         # render before seasonal noms since the monthly cadence is the more
-        # common cycle members watch week-to-week.
-        monthly_noms = [r for r in noms if r[3] == r[4]]
-        seasonal_noms = [r for r in noms if r[3] != r[4]]
+        # common cycle members watch week-to-week. The lane filter above
+        # already means only one of the two can be non-empty.
+        monthly_noms = [] if seasonal_lane else noms
+        seasonal_noms = noms if seasonal_lane else []
         sections: list[tuple[str, list[str]]] = []
         for label_emoji, label_text, section_rows in (
             ("📌", "Picks", picks),
@@ -1733,40 +1650,46 @@ class VNTitleManagement(commands.Cog):
         ``_build_pool_pages``); this method emits every row.
         """
         lines: list[str] = []
+        # all_servers views repeat a handful of guild ids across many rows.
+        server_tags: dict[Optional[int], str] = {}
         for row in rows:
             (rid, vndb_id, gid, start_m, end_m, pts, _ca, title_ja, title_en,
              status, cycle_id, nominator_user_id, title_cache,
              phase, kind, _target_m, _target_end_m, _winner_flag) = row
             emoji, tag = _pool_row_tag(row)
-            display_title = title_ja or title_en or title_cache or vndb_id
-            link = f"https://vndb.org/{vndb_id}"
-            period = start_m if start_m == end_m else f"{start_m}–{end_m}"
-            server_tag = self._server_tag(bot, gid) if all_servers else ""
-            # Hide the period segment when it matches the view's range.
-            period_segment = (
-                "" if (start_m == expected_start and end_m == expected_end)
-                else f" · {period}"
-            )
+            if all_servers:
+                if gid not in server_tags:
+                    server_tags[gid] = self._server_tag(bot, gid)
+                server_tag = server_tags[gid]
+            else:
+                server_tag = ""
             if status == "nominated":
-                nominator = (
-                    f"<@{nominator_user_id}>" if nominator_user_id else "unknown"
-                )
                 # Monthly vs seasonal is implicit in the section header
                 # the row is rendered under, so we don't repeat it here.
-                line = (
-                    f"{emoji} `[{tag}]` **#{rid}** [{display_title}]({link}) "
-                    f"`{vndb_id}`{period_segment} · {nominator}{server_tag}"
-                )
+                tail = f"<@{nominator_user_id}>" if nominator_user_id else "unknown"
             else:
-                line = (
-                    f"{emoji} `[{tag}]` **#{rid}** [{display_title}]({link}) "
-                    f"`{vndb_id}`{period_segment} · **{pts}**点{server_tag}"
-                )
+                tail = f"**{pts}**点"
+            fields = {
+                "emoji": emoji,
+                "tag": tag,
+                "rid": rid,
+                "title": title_ja or title_en or title_cache or vndb_id,
+                "vndb_id": vndb_id,
+                # Hide the period segment when it matches the view's range.
+                "period": (
+                    "" if (start_m == expected_start and end_m == expected_end)
+                    else f" · {start_m if start_m == end_m else f'{start_m}–{end_m}'}"
+                ),
+                "tail": tail,
+                "server": server_tag,
+            }
+            line = _POOL_LINE_TEMPLATE.format_map(fields)
             # Truncate the title if a single row would exceed the per-row cap.
             if len(line) > _POOL_ROW_HARD_CAP:
+                title = fields["title"]
                 overflow = len(line) - _POOL_ROW_HARD_CAP + 1  # +1 for ellipsis
-                truncated_title = display_title[: max(1, len(display_title) - overflow)] + "…"
-                line = line.replace(f"[{display_title}]", f"[{truncated_title}]", 1)
+                fields["title"] = title[: max(1, len(title) - overflow)] + "…"
+                line = _POOL_LINE_TEMPLATE.format_map(fields)
             lines.append(line)
         return lines
 
@@ -1856,56 +1779,71 @@ class VNTitleManagement(commands.Cog):
         # fails are dropped (and logged) so a partial-failure VNDB outage
         # doesn't sink the entire command — but the paginator still works
         # for the remaining entries.
-        entries: list[dict] = []
+        # Resolve every row's VNDB entry up front in one bounded fan-out
+        # rather than one serial round-trip per row.
+        vn_infos = await _fetch_vn_entries(
+            interaction.client, [row[1] for row in results],
+        )
         async with JitenClient() as jiten, MonthlyBannerGenerator() as banner_gen:
-            for row in results:
+            # Pages render concurrently (jiten lookup, VNDB extras, cover
+            # download and the threaded PIL render overlap across rows),
+            # capped so a big pool doesn't hold many 2x banners in memory
+            # at once or burst the upstream APIs.
+            render_sem = asyncio.Semaphore(_BANNER_RENDER_CONCURRENCY)
+
+            async def _render_entry(row, vn_info: Optional[VN_Entry]) -> Optional[dict]:
                 # GET_CURRENT_*_VNS_FOR_GUILD column shape:
                 # (id, vndb_id, guild_id, start_month, end_month,
                 #  is_monthly_points, status, created_at)
                 _id, vndb_id, _guild_id, start_month, end_month, is_monthly_points, _status, _created_at = row
-                vn_info: Optional[VN_Entry] = await from_vndb_id(interaction.client, vndb_id)
                 if not vn_info:
                     _log.error("Failed to fetch VNDB info for ID %s", vndb_id)
-                    continue
+                    return None
 
-                jiten_data = None
-                try:
-                    jiten_data = await jiten.get_by_vndb_id(vndb_id)
-                except Exception as e:  # noqa: BLE001
-                    _log.warning("jiten lookup failed for %s: %s", vndb_id, e)
-                jiten_deck_id = jiten_data.deck_id if jiten_data else None
-
-                payload: dict = {
-                    "pool_id": _id,
-                    "vndb_id": vndb_id,
-                    "jiten_deck_id": jiten_deck_id,
-                }
-                if embed:
-                    payload["legacy_embed"] = await EmbedBuilder.create_vn_info_embed(
-                        vn_info, start_month, end_month, is_monthly_points,
-                        title_prefix=embed_title_prefix,
-                        color=discord.Color.blue(),
-                        pool_id=_id, jiten_data=jiten_data,
-                    )
-                else:
-                    vndb_extras = await fetch_vndb_extras(vndb_id)
-                    if kind == "seasonal":
-                        period_label = await format_season_label_from_yyyy_mm(
-                            self.bot, start_month
+                async with render_sem:
+                    jiten_data = None
+                    try:
+                        jiten_data = await jiten.get_by_vndb_id(vndb_id)
+                    except Exception as e:  # noqa: BLE001
+                        _log.warning("jiten lookup failed for %s: %s", vndb_id, e)
+                    jiten_deck_id = jiten_data.deck_id if jiten_data else None
+
+                    payload: dict = {
+                        "pool_id": _id,
+                        "vndb_id": vndb_id,
+                        "jiten_deck_id": jiten_deck_id,
+                    }
+                    if embed:
+                        payload["legacy_embed"] = await EmbedBuilder.create_vn_info_embed(
+                            vn_info, start_month, end_month, is_monthly_points,
+                            title_prefix=embed_title_prefix,
+                            color=discord.Color.blue(),
+                            pool_id=_id, jiten_data=jiten_data,
                         )
                     else:
-                        period_label = None
-                    buf = await render_banner_for_vn_entry(
-                        banner_gen, vn_info, jiten_data, start_month,
-                        vndb_extras=vndb_extras,
-                        target_end_month=end_month,
-                        eyebrow_label=eyebrow_suffix,
-                        period_label_override=period_label,
-                        cover_mode=cover_mode,
-                    )
-                    payload["file_buf"] = buf
-                    payload["filename"] = f"vn-of-the-{file_kind_tag}-{vndb_id}.png"
-                entries.append(payload)
+                        vndb_extras = await fetch_vndb_extras(vndb_id)
+                        if kind == "seasonal":
+                            period_label = await format_season_label_from_yyyy_mm(
+                                self.bot, start_month
+                            )
+                        else:
+                            period_label = None
+                        buf = await render_banner_for_vn_entry(
+                            banner_gen, vn_info, jiten_data, start_month,
+                            vndb_extras=vndb_extras,
+                            target_end_month=end_month,
+                            eyebrow_label=eyebrow_suffix,
+                            period_label_override=period_label,
+                            cover_mode=cover_mode,
+                        )
+                        payload["file_buf"] = buf
+                        payload["filename"] = f"vn-of-the-{file_kind_tag}-{vndb_id}.png"
+                    return payload
+
+            rendered = await asyncio.gather(
+                *(_render_entry(row, vn_info) for row, vn_info in zip(results, vn_infos))
+            )
+        entries: list[dict] = [payload for payload in rendered if payload is not None]
 
         if not entries:
             await interaction.followup.send(
@@ -2073,15 +2011,24 @@ class VNTitleManagement(commands.Cog):
                     period_label_override=season_label,
                 )
 
-            for month in season_months:
-                rows = await self.bot.GET(
+            rows_by_month = [
+                await self.bot.GET(
                     DatabaseQueries.GET_CURRENT_MONTHLY_VNS_FOR_GUILD,
                     (month, month, guild_id),
-                )
+                ) or []
+                for month in season_months
+            ]
+            # One bounded fan-out for every monthly pick in the season
+            # instead of a serial VNDB round-trip per pick.
+            monthly_vns = iter(await _fetch_vn_entries(
+                bot_for_vndb,
+                [row[1] for rows in rows_by_month for row in rows],
+            ))
+            for month, rows in zip(season_months, rows_by_month):
                 picks: list[dict] = []
-                for row in rows or []:
+                for row in rows:
                     _mid, m_vndb_id, _mg, _ms, _me, _mp, _mst, _mca = row
-                    m_vn = await from_vndb_id(bot_for_vndb, m_vndb_id)
+                    m_vn = next(monthly_vns)
                     if not m_vn:
                         _log.warning("season_overview: VNDB miss for monthly %s", m_vndb_id)
                         continue
@@ -2135,8 +2082,11 @@ class VNTitleManagement(commands.Cog):
     def _invalidate_season_overview_cache(self) -> None:
         """Drop every cached /season_overview render so admins who edit the
         pool see fresh overviews without a bot restart. Process-local cache,
-        so clearing is in-memory and cheap."""
+        so clearing is in-memory and cheap. Also drops the pool rows behind
+        vn_pool_autocomplete; vn_cycle's own pool writes (/nominate, Open
+        voting) call forget_pool_autocomplete() directly."""
         self._season_overview_cache.clear()
+        forget_pool_autocomplete()
 
     async def _get_or_build_season_overview_payload(
         self,
@@ -1,14 +1,16 @@
 import asyncio
 import discord
 import discord.app_commands as app_commands
+import heapq
 import json
 import logging
+from collections import Counter, defaultdict
 from datetime import datetime
 from typing import List, Optional, Tuple
 from discord.ext import commands
 from lib.autocomplete import HELP_JSON_PATH
 from lib.bot import VNClubBot
-from lib.vndb_api import from_vndb_id, VN_Entry
+from lib.vndb_api import from_vndb_id, from_vndb_ids, VN_Entry
 from lib.jiten_client import JitenClient, JitenInfo, resolve_display_cover
 from lib.pagination import BasePaginationView, GenericPaginationView
 from lib.utils import (
@@ -23,23 +25,26 @@ from lib.utils import (
     next_season,
     validate_user_permission,
     validate_rating_input,
+    validate_month_input,
     handle_command_error,
     truncate_text,
     BotError,
     ValidationError,
     MAX_DISCORD_MESSAGE,
-    MAX_EMBED_DESCRIPTION,
-    EMBED_DESCRIPTION_BUFFER,
+    EMBED_DESCRIPTION_LIMIT,
+    RATING_STARS,
     DEFAULT_TIMEOUT,
     create_base_embed,
     add_pagination_footer,
+    create_vndb_link,
     resolve_vn_from_input,
     require_same_guild,
 )
 from lib.embeds import EmbedBuilder, build_vn_links_view
 from lib.autocomplete import vn_autocomplete, user_logs_autocomplete, month_autocomplete, month_picker_past_autocomplete, year_autocomplete, server_autocomplete, help_command_autocomplete, RATING_CHOICES
-from .username_fetcher import get_username_db
+from .username_fetcher import get_usernames_db
 from math import ceil
+from operator import itemgetter
 
 _log = logging.getLogger(__name__)
 
@@ -69,18 +74,18 @@ async def _cache_jiten_character_count(bot: VNClubBot, vndb_id: str) -> Optional
 
 async def _user_rank_in(bot, user_id, query_const, params):
     """Return (rank, total) for `user_id` against the rows produced by the
-    given leaderboard query, or None if the user has no rows in scope.
-    Mirrors the per-user aggregation pattern used by /leaderboard."""
-    rows = await bot.GET(query_const, params)
-    totals: dict[int, int] = {}
-    for row in rows:
-        uid, _v, _r, _m, pts, _c, _g = row
-        totals[uid] = totals.get(uid, 0) + pts
-    if user_id not in totals:
+    given GET_LEADERBOARD_* query, or None if the user has no rows in scope.
+    Rows arrive aggregated and in /leaderboard's order, so the rank is the
+    row position; they're streamed since only the count is kept."""
+    rank = None
+    total = 0
+    async for uid, _pts, _completions in bot.ITER(query_const, params):
+        total += 1
+        if uid == user_id:
+            rank = total
+    if rank is None:
         return None
-    sorted_users = sorted(totals.items(), key=lambda x: x[1], reverse=True)
-    rank = next(i for i, (uid, _) in enumerate(sorted_users, 1) if uid == user_id)
-    return rank, len(sorted_users)
+    return rank, total
 
 
 SEASON_CHOICES = [
@@ -115,6 +120,12 @@ _HELP_CATEGORY_ORDER = [
 _HELP_CATEGORY_LABELS = dict(_HELP_CATEGORY_ORDER)
 
 
+def _load_help_commands() -> list:
+    """Read the ``commands`` list from help_commands.json. Blocking."""
+    with open(HELP_JSON_PATH, "r", encoding="utf-8") as f:
+        return json.load(f).get("commands", [])
+
+
 def _build_help_compact_embed(help_data: list) -> discord.Embed:
     """Categorized one-page overview. One embed field per category, value lists
     each command in the category as `**/name** — short description`."""
@@ -258,12 +269,120 @@ class HelpDetailView(discord.ui.View):
         )
 
 
+# /delete_log confirmation. Every field is truncated before formatting, so
+# the message stays well under Discord's 2000-char limit.
+_DELETED_LOG_TEMPLATE = (
+    "✅ Deleted log #{log_id} for <@{user_id}>:\n"
+    "**Title:** {title}\n"
+    "**Reward Reason:** {reason}\n"
+    "**Reward Month:** {month}\n"
+    "**Points:** {points}\n"
+    "**Comment:** {comment}"
+)
+
+
+# One /logs entry. ``vn`` is a title link, the bare vndb_id when the VN
+# couldn't be resolved, or a placeholder for non-VN rewards (which also
+# drop the rating suffix).
+_LOG_ENTRY_TEMPLATE = (
+    "`#{log_id}` **{month}**: {vn} - {points}点 ({reason})\n"
+    "Comment: {comment}{rating}"
+)
+
+
+def _format_log_entry(row, vn_infos: dict[str, VN_Entry]) -> str:
+    """Render one GET_USER_LOGS_PAGE row; ``vn_infos`` covers VNs the query's
+    vndb_cache join missed."""
+    (log_id, _user_id, vndb_id, user_rating, reward_reason, reward_month,
+     points, comment, _logged_in_guild, title_ja, title_en, cached) = row
+    if not vndb_id:
+        vn, rating = "No VN specified", ""
+    else:
+        link = create_vndb_link(vndb_id)
+        if not cached:
+            vn_info = vn_infos.get(vndb_id if vndb_id.startswith("v") else f"v{vndb_id}")
+            if vn_info:
+                cached, title_ja, title_en = True, vn_info.title_ja, vn_info.title_en
+                link = vn_info.vndb_link
+        # Prioritize Japanese title, fallback to English title, or generic text if both are empty
+        vn = f"[{title_ja or title_en or 'View on VNDB'}]({link})" if cached else vndb_id
+        rating = f" | Rating: {user_rating or 'No rating provided.'}/5"
+    return _LOG_ENTRY_TEMPLATE.format(
+        log_id=log_id, month=reward_month, vn=vn, points=points,
+        reason=reward_reason, comment=comment or 'No comment provided.',
+        rating=rating,
+    )
+
+
+async def _format_log_rows(bot, rows) -> list[str]:
+    """Render GET_USER_LOGS_PAGE rows. Titles for cached VNs came back with
+    the logs; only VNs missing from vndb_cache need resolving (one bounded
+    concurrent batch)."""
+    misses = [row[2] for row in rows if row[2] and not row[11]]
+    vn_infos = await from_vndb_ids(bot, misses) if misses else {}
+    return [_format_log_entry(row, vn_infos) for row in rows]
+
+
 class ReadingLogsView(BasePaginationView):
-    """Paginated view for user reading logs"""
+    """Paginated view for user reading logs.
+
+    Only ``total`` is known up front; each page's ``per_page`` rows are
+    read and formatted on first visit by ``load_page``, so a member with
+    hundreds of logs doesn't pay for all of them to show five.
+    """
     
-    def __init__(self, logs_data, member, per_page=5):
+    def __init__(self, bot, member, total, per_page=5):
+        self.bot = bot
         self.member = member
-        super().__init__(logs_data, f"📚 Reading Logs for {member.name}", per_page)
+        self.total = total
+        # Formatted entries by page index, filled by load_page().
+        self._page_entries: dict[int, list[str]] = {}
+        # Page the message currently shows, to step back to if a load fails.
+        self._shown_page = 0
+        super().__init__([], f"📚 Reading Logs for {member.name}", per_page)
+
+    def _calculate_max_pages(self) -> int:
+        return max(1, ceil(self.total / self.per_page))
+
+    async def load_page(self) -> list[str]:
+        """Fetch and format the current page's entries, once per page."""
+        entries = self._page_entries.get(self.current_page)
+        if entries is None:
+            rows = await self.bot.GET(
+                DatabaseQueries.GET_USER_LOGS_PAGE,
+                (self.member.id, self.per_page, self.current_page * self.per_page),
+            )
+            entries = self._page_entries[self.current_page] = await _format_log_rows(self.bot, rows)
+        return entries
+
+    def get_page_data(self) -> List[str]:
+        return self._page_entries.get(self.current_page, [])
+
+    async def _navigate(self, interaction: discord.Interaction, action: str):
+        if self.current_page in self._page_entries:
+            self._shown_page = self.current_page
+            await super()._navigate(interaction, action)
+            return
+        # An unvisited page may wait on VNDB for uncached titles, which can
+        # outlast Discord's 3s ack window, so acknowledge the click first.
+        await interaction.response.defer()
+        try:
+            await self.load_page()
+            await interaction.edit_original_response(
+                embed=self.current_page_embed(), view=self,
+            )
+            self._shown_page = self.current_page
+        except Exception:
+            _log.exception(
+                "reading logs page load failed: action=%s page=%d/%d member=%s",
+                action, self.current_page + 1, self.max_pages, self.member.id,
+            )
+            self.current_page = self._shown_page
+            self._update_button_states()
+            await interaction.followup.send(
+                "❌ Couldn't load that page right now. Please try again.",
+                ephemeral=True,
+            )
     
     def create_embed(self):
         """Create an embed for the current page"""
@@ -283,47 +402,26 @@ class ReadingLogsView(BasePaginationView):
             combined_description = "\n\n".join(page_data)
             
             # Ensure description doesn't exceed Discord's limit
-            if len(combined_description) > MAX_EMBED_DESCRIPTION - EMBED_DESCRIPTION_BUFFER:
-                combined_description = combined_description[:MAX_EMBED_DESCRIPTION - EMBED_DESCRIPTION_BUFFER - 3] + "..."
-            
-            embed.description = combined_description
+            embed.description = truncate_text(combined_description, EMBED_DESCRIPTION_LIMIT)
         
-        add_pagination_footer(embed, self.current_page, self.max_pages, len(self.data))
+        add_pagination_footer(embed, self.current_page, self.max_pages, self.total)
         return embed
 
 
-async def _aggregate_leaderboard_rows(bot, rows) -> list[dict]:
-    """Bucket reading_logs rows into per-user (points, completions) entries
-    sorted by points desc, completions desc.
+async def _leaderboard_entries(bot, rows) -> list[dict]:
+    """Turn GET_LEADERBOARD_* rows ``(user_id, points, completions)`` —
+    already aggregated and ranked in SQL — into the dicts LeaderboardView
+    renders, resolving one username per user.
 
     Centralized so the leaderboard slash command and the season-nav button
-    callbacks share the exact same aggregation rules — without this, the
-    nav buttons would drift from the initial render's behavior over time.
+    callbacks share the exact same shape — without this, the nav buttons
+    would drift from the initial render's behavior over time.
     """
-    agg: dict[int, dict] = {}
-    for row in rows:
-        (
-            user_id,
-            vndb_id,
-            _reward_reason,
-            _reward_month,
-            points,
-            _comment,
-            _logged_in_guild,
-        ) = row
-        bucket = agg.setdefault(
-            user_id, {"points": 0, "completions": 0, "username": None}
-        )
-        bucket["points"] += points
-        if vndb_id:
-            bucket["completions"] += 1
-    for uid, data in agg.items():
-        data["username"] = await get_username_db(bot, uid)
-    return sorted(
-        agg.values(),
-        key=lambda d: (d["points"], d["completions"]),
-        reverse=True,
-    )
+    usernames = await get_usernames_db(bot, map(itemgetter(0), rows))
+    return [
+        {"points": pts, "completions": completions, "username": usernames[user_id]}
+        for user_id, pts, completions in rows
+    ]
 
 
 class LeaderboardView(BasePaginationView):
@@ -411,12 +509,12 @@ class SeasonNavLeaderboardView(LeaderboardView):
         months = season_to_months(new_season, new_year)
         if self._server_id is not None:
             rows = await self._bot.GET(
-                DatabaseQueries.GET_LOGS_BY_SEASON_AND_SERVER,
+                DatabaseQueries.GET_LEADERBOARD_BY_SEASON_AND_SERVER,
                 (*months, self._server_id),
             )
         else:
             rows = await self._bot.GET(
-                DatabaseQueries.GET_LOGS_BY_SEASON, tuple(months),
+                DatabaseQueries.GET_LEADERBOARD_BY_SEASON, tuple(months),
             )
         slabel = await format_season_label(self._bot, new_year, new_season)
         if not rows:
@@ -424,7 +522,7 @@ class SeasonNavLeaderboardView(LeaderboardView):
                 f"No leaderboard data for {slabel}.", ephemeral=True,
             )
             return
-        sorted_entries = await _aggregate_leaderboard_rows(self._bot, rows)
+        sorted_entries = await _leaderboard_entries(self._bot, rows)
         if self._server_id is not None:
             guild = self._bot.get_guild(self._server_id)
             srv_name = guild.name if guild else f"Server {self._server_id}"
@@ -439,6 +537,7 @@ class SeasonNavLeaderboardView(LeaderboardView):
         self.title = f"🏆 VN Club Leaderboard — {plabel}"
         self.data = sorted_entries
         self.current_page = 0
+        self._reset_page_cache()
         # max_pages depends on data length — recompute via the base class's
         # own logic (BasePaginationView caches this; reseting current_page
         # alone is fine here because create_embed uses len(self.data)).
@@ -446,7 +545,7 @@ class SeasonNavLeaderboardView(LeaderboardView):
             self.max_pages = max(1, -(-len(sorted_entries) // self.per_page))
         except Exception:  # noqa: BLE001
             pass
-        await interaction.response.edit_message(embed=self.create_embed(), view=self)
+        await interaction.response.edit_message(embed=self.current_page_embed(), view=self)
 
 
 class _PrevSeasonLeaderboardButton(discord.ui.Button):
@@ -489,40 +588,41 @@ async def _build_server_standings_embed(
     same render — keeps button-driven re-renders visually identical to
     the initial post.
     """
-    per_server: dict[int, dict[int, int]] = {}
-    for row in rows:
-        (
-            user_id, vndb_id, _reward_reason, _reward_month,
-            points, _comment, logged_in_guild,
-        ) = row
-        if logged_in_guild is None:
-            continue
-        srv = per_server.setdefault(logged_in_guild, {})
-        srv[user_id] = srv.get(user_id, 0) + points
-
-    server_totals: list[tuple[int, int]] = []
-    all_user_ids: set[int] = set()
-    for guild_id, users in per_server.items():
-        if not users:
+    # rows: (logged_in_guild, user_id, points) from GET_SERVER_STANDINGS_*.
+    per_server: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+    for guild_id, user_id, pts in rows:
+        if guild_id is None:
             continue
-        server_totals.append((guild_id, sum(users.values())))
-        all_user_ids.update(users.keys())
-    if not server_totals:
+        per_server[guild_id].append((user_id, pts))
+    if not per_server:
         return None
 
-    username_cache: dict[int, str] = {}
-    for uid in all_user_ids:
-        username_cache[uid] = await get_username_db(bot, uid)
-
-    server_totals.sort(key=lambda x: x[1], reverse=True)
+    server_totals: list[tuple[int, int]] = sorted(
+        ((guild_id, sum(pts for _uid, pts in users))
+         for guild_id, users in per_server.items()),
+        key=itemgetter(1), reverse=True,
+    )
     total_points_all = sum(t for _, t in server_totals)
 
+    # Only the podium plus the overflow fields are ever rendered, and only
+    # their top users need a name — resolve just those.
+    TOP_USERS_PER_SERVER = 5
+    MAX_FIELDS_TOTAL = 25
+    max_overflow_fields = MAX_FIELDS_TOTAL - 1
+    top_by_server = {
+        guild_id: heapq.nlargest(
+            TOP_USERS_PER_SERVER, per_server[guild_id], key=itemgetter(1),
+        )
+        for guild_id, _total in server_totals[:3 + max_overflow_fields]
+    }
+    username_cache = await get_usernames_db(
+        bot, (uid for top in top_by_server.values() for uid, _pts in top),
+    )
+
     def _top_users_lines(guild_id: int, n: int) -> list[tuple[str, int]]:
-        users = per_server[guild_id]
-        sorted_users = sorted(users.items(), key=lambda x: x[1], reverse=True)
         return [
             (username_cache.get(uid, f"User {uid}"), pts)
-            for uid, pts in sorted_users[:n]
+            for uid, pts in top_by_server[guild_id][:n]
         ]
 
     def _server_name(guild_id: int) -> str:
@@ -534,7 +634,6 @@ async def _build_server_standings_embed(
         color=discord.Color.gold(),
     )
 
-    TOP_USERS_PER_SERVER = 5
     podium_emojis = ["🥇", "🥈", "🥉"]
     podium_blocks: list[str] = []
     for i, (guild_id, total) in enumerate(server_totals[:3]):
@@ -551,9 +650,7 @@ async def _build_server_standings_embed(
     if podium_blocks:
         embed.description = "\n\n".join(podium_blocks)
 
-    MAX_FIELDS_TOTAL = 25
     remaining = server_totals[3:]
-    max_overflow_fields = MAX_FIELDS_TOTAL - 1
     shown = remaining[:max_overflow_fields]
     for i, (guild_id, total) in enumerate(shown, start=4):
         display = truncate_text(_server_name(guild_id), 50)
@@ -581,20 +678,41 @@ async def _build_server_standings_embed(
 
 
 class SeasonNavServerStandingsView(discord.ui.View):
-    """Single-season server standings view with prev/next-season nav."""
+    """Single-season server standings view with prev/next-season nav.
 
-    def __init__(self, bot, season_value: str, season_year: int):
+    Rendered seasons are kept for the life of the view, so paging back to
+    a season already shown re-sends its embed instead of re-querying and
+    re-resolving names. ``embed`` is the one the view was first sent with.
+    """
+
+    def __init__(self, bot, season_value: str, season_year: int, embed: discord.Embed):
         super().__init__(timeout=300)
         self._bot = bot
         self._season_value = season_value
         self._season_year = season_year
+        self._season_embeds: dict[tuple[int, str], discord.Embed] = {
+            (season_year, season_value): embed,
+        }
         self.add_item(_PrevSeasonServerStandingsButton())
         self.add_item(_NextSeasonServerStandingsButton())
 
     async def _shift_season(self, interaction, new_year: int, new_season: str):
+        embed = self._season_embeds.get((new_year, new_season))
+        if embed is None:
+            embed = await self._render_season(interaction, new_year, new_season)
+            if embed is None:
+                return
+            self._season_embeds[(new_year, new_season)] = embed
+        self._season_value = new_season
+        self._season_year = new_year
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def _render_season(self, interaction, new_year: int, new_season: str) -> Optional[discord.Embed]:
+        """Build the standings embed for one season, or tell the user there's
+        nothing there and return None."""
         months = season_to_months(new_season, new_year)
         rows = await self._bot.GET(
-            DatabaseQueries.GET_LOGS_BY_SEASON, tuple(months),
+            DatabaseQueries.GET_SERVER_STANDINGS_BY_SEASON, tuple(months),
         )
         period_label = await format_season_label(
             self._bot, new_year, new_season,
@@ -606,10 +724,7 @@ class SeasonNavServerStandingsView(discord.ui.View):
             await interaction.response.send_message(
                 f"No server data for {period_label}.", ephemeral=True,
             )
-            return
-        self._season_value = new_season
-        self._season_year = new_year
-        await interaction.response.edit_message(embed=embed, view=self)
+        return embed
 
 
 class _PrevSeasonServerStandingsButton(discord.ui.Button):
@@ -684,10 +799,7 @@ class VNRatingsView(BasePaginationView):
                 combined_description = average_info + combined_description
 
             # Ensure description doesn't exceed Discord's limit
-            if len(combined_description) > MAX_EMBED_DESCRIPTION - EMBED_DESCRIPTION_BUFFER:
-                combined_description = combined_description[:MAX_EMBED_DESCRIPTION - EMBED_DESCRIPTION_BUFFER - 3] + "..."
-
-            embed.description = combined_description
+            embed.description = truncate_text(combined_description, EMBED_DESCRIPTION_LIMIT)
 
         add_pagination_footer(embed, self.current_page, self.max_pages, len(self.data))
         return embed
@@ -766,34 +878,6 @@ class UndoLogView(discord.ui.View):
                 pass
 
 
-# ==================== HELPER FUNCTIONS ====================
-
-
-async def log_already_exists(
-    interaction: discord.Interaction,
-    user_id: int,
-    vndb_id: str,
-    reward_month: str,
-) -> bool:
-    """Check whether the user already has a log for this VN in this month.
-
-    Re-reads in *different* months are allowed (mirrors how the same VN can
-    be in the pool multiple times across periods); only a same-month
-    duplicate is rejected.
-    """
-    result = await interaction.client.GET_ONE(
-        DatabaseQueries.GET_USER_VN_LOG_FOR_MONTH,
-        (user_id, vndb_id, reward_month),
-    )
-    if result:
-        await interaction.followup.send(
-            f"You've already logged this VN for **{reward_month}**. "
-            "Re-reads in a different month are fine."
-        )
-        return True
-    return False
-
-
 # ==================== MAIN COG CLASS ====================
 
 class VNUserCommands(commands.Cog):
@@ -812,12 +896,18 @@ class VNUserCommands(commands.Cog):
         # makes ADD_READING_LOG_OR_IGNORE race-safe.
         for stmt in DatabaseQueries.CREATE_READING_LOGS_INDEXES:
             await self.bot.RUN(stmt)
+        # Trigger-maintained per-user totals read by the role-reward tick.
+        # Rebuilt in one transaction so the table is never observed empty.
+        for stmt in DatabaseQueries.CREATE_USER_POINTS_TOTALS:
+            await self.bot.RUN(stmt)
+        await self.bot.RUN_TRANSACTION(list(DatabaseQueries.REBUILD_USER_POINTS_TOTALS))
         # Pre-load help data so the first /help isn't paying disk + decode cost.
         # Use the absolute path constant so the cog works regardless of CWD
         # (systemd / Docker entrypoint may not start at the project root).
+        # The read + decode runs in a worker thread so cog load doesn't
+        # block the event loop on disk I/O.
         try:
-            with open(HELP_JSON_PATH, "r", encoding="utf-8") as f:
-                self._help_data = json.load(f).get("commands", [])
+            self._help_data = await asyncio.to_thread(_load_help_commands)
         except Exception as e:  # noqa: BLE001
             _log.error("Failed to preload help_commands.json: %s", e)
             self._help_data = None
@@ -881,17 +971,27 @@ class VNUserCommands(commands.Cog):
                 raise ValidationError("Could not determine VN from input. Please try selecting from the autocomplete dropdown.")
 
             # Validate inputs (comment length is enforced by Range on the param)
-            await validate_rating_input(rating)
+            validate_rating_input(rating)
 
             current_month = get_current_month()
 
-            # Check if this VN is currently in this server's pool window.
-            # Legacy rows with guild_id IS NULL also match (treated as global).
-            # The kind ('monthly' / 'seasonal' / 'special') drives the
-            # reward_reason label below — points logic itself is unchanged.
-            result = await get_single_monthly_vn(
-                interaction.client, vndb_id,
-                guild_id=interaction.guild.id if interaction.guild else None,
+            # The pool-window lookup, VN metadata and the user's running
+            # total don't depend on each other — fetch them
+            # concurrently, then apply the checks in the original order.
+            # Pool window: legacy rows with guild_id IS NULL also match
+            # (treated as global). The kind ('monthly' / 'seasonal' /
+            # 'special') drives the reward_reason label below — points
+            # logic itself is unchanged.
+            result, vn_info, current_total_result = await asyncio.gather(
+                get_single_monthly_vn(
+                    interaction.client, vndb_id,
+                    guild_id=interaction.guild.id if interaction.guild else None,
+                    current_month=current_month,
+                ),
+                from_vndb_id(self.bot, vndb_id),
+                self.bot.GET_ONE(
+                    DatabaseQueries.GET_USER_TOTAL_POINTS, (interaction.user.id,)
+                ),
             )
             entry_status = None
             if result:
@@ -900,8 +1000,6 @@ class VNUserCommands(commands.Cog):
             else:
                 read_in_pool_window = False
 
-            # Get VN info
-            vn_info: VN_Entry = await from_vndb_id(self.bot, vndb_id)
             if not vn_info:
                 # `from_vndb_id` returns None for both "VN doesn't exist on
                 # VNDB" and "VNDB API was unreachable" (after retries). Most
@@ -915,14 +1013,6 @@ class VNUserCommands(commands.Cog):
                     "the error persists, double-check the ID.",
                 )
 
-            # Check for a same-month duplicate. Re-reads in different months
-            # are allowed — mirrors how a VN can be in the pool across multiple
-            # periods.
-            if await log_already_exists(
-                interaction, interaction.user.id, vndb_id, current_month,
-            ):
-                return
-
             # Calculate points + craft reward_reason. When the VN is in its
             # pool window, the reason names the kind (Monthly/Seasonal/Special).
             # Otherwise it's "As Normal VN" — the implicit catch-all for VNs
@@ -936,13 +1026,9 @@ class VNUserCommands(commands.Cog):
                 }.get(entry_status or "monthly", "Monthly")
                 reward_reason = f"As {kind_label} VN"
             else:
-                reward_points = await vn_info.get_points_not_monthly()
+                reward_points = vn_info.points_not_monthly
                 reward_reason = "As Normal VN"
 
-            # Get current points
-            current_total_result = await self.bot.GET_ONE(
-                DatabaseQueries.GET_USER_TOTAL_POINTS, (interaction.user.id,)
-            )
             current_total_points = current_total_result[0] if current_total_result and current_total_result[0] else 0
 
             _log.info(
@@ -963,14 +1049,13 @@ class VNUserCommands(commands.Cog):
                 _log.debug("badge before-snapshot failed: %s", e)
                 before_badges = None
 
-            # Add log to database and get the log_id. OR IGNORE +
-            # partial unique index on (user_id, vndb_id, reward_month)
-            # closes the TOCTOU gap between log_already_exists above
-            # and this insert: if another /finish for the same key
-            # raced past the pre-check, the constraint catches it and
-            # log_id comes back as 0 (no row inserted on a fresh
-            # connection's lastrowid).
-            log_id = await self.bot.RUN_RETURNING_ID(
+            # Add log to database and get the log_id. This insert is the
+            # same-month duplicate check: OR IGNORE + the partial unique
+            # index on (user_id, vndb_id, reward_month) leaves an existing
+            # log alone and RETURNING yields no row. Re-reads in different
+            # months are allowed — mirrors how a VN can be in the pool
+            # across multiple periods.
+            inserted = await self.bot.RUN_RETURNING(
                 DatabaseQueries.ADD_READING_LOG_OR_IGNORE,
                 (
                     interaction.user.id,
@@ -983,15 +1068,13 @@ class VNUserCommands(commands.Cog):
                     interaction.guild.id,
                 ),
             )
-            if not log_id:
-                # Race: a concurrent /finish for the same VN in the
-                # same month inserted first. Same message as the
-                # pre-check fast path so the UX is consistent.
+            if not inserted:
                 await interaction.followup.send(
                     f"You've already logged this VN for **{current_month}**. "
                     "Re-reads in a different month are fine."
                 )
                 return
+            log_id = inserted[0][0]
 
             new_total_points = current_total_points + reward_points
 
@@ -1046,7 +1129,7 @@ class VNUserCommands(commands.Cog):
             )
 
             # Create view with undo button and VNDB / jiten.moe link buttons
-            vndb_url = await vn_info.get_vndb_link()
+            vndb_url = vn_info.vndb_link
             view = UndoLogView(
                 log_id, interaction.user.id, vndb_url, self.bot,
                 jiten_deck_id=jiten_deck_id,
@@ -1153,36 +1236,41 @@ class VNUserCommands(commands.Cog):
                         self.bot, cur_year, cur_season
                     )
 
+            # Resolve the server filter once; the query params, the empty
+            # result message and the title all use it.
+            server_id: Optional[int] = None
+            server_name: Optional[str] = None
+            if server:
+                server_id = int(server)
+                guild = self.bot.get_guild(server_id)
+                server_name = guild.name if guild else f"Server {server}"
+
             # Choose the appropriate query based on the resolved filters.
             if season_months is not None and server:
                 results = await self.bot.GET(
-                    DatabaseQueries.GET_LOGS_BY_SEASON_AND_SERVER,
-                    (*season_months, int(server)),
+                    DatabaseQueries.GET_LEADERBOARD_BY_SEASON_AND_SERVER,
+                    (*season_months, server_id),
                 )
-                guild = self.bot.get_guild(int(server))
-                server_name = guild.name if guild else f"Server {server}"
                 filter_description = f"for **{season_label}** in **{server_name}**"
             elif season_months is not None:
                 results = await self.bot.GET(
-                    DatabaseQueries.GET_LOGS_BY_SEASON,
+                    DatabaseQueries.GET_LEADERBOARD_BY_SEASON,
                     tuple(season_months),
                 )
                 filter_description = f"for **{season_label}** (all servers)"
             elif month and server:
-                results = await self.bot.GET(DatabaseQueries.GET_LOGS_BY_MONTH_AND_SERVER, (month, int(server)))
-                filter_description = f"for **{month}** in server"
+                results = await self.bot.GET(DatabaseQueries.GET_LEADERBOARD_BY_MONTH_AND_SERVER, (month, server_id))
+                filter_description = f"for **{month}** in **{server_name}**"
             elif month:
-                results = await self.bot.GET(DatabaseQueries.GET_LOGS_BY_MONTH, (month,))
+                results = await self.bot.GET(DatabaseQueries.GET_LEADERBOARD_BY_MONTH, (month,))
                 filter_description = f"for **{month}** (all servers)"
             elif server:
                 # All-time + server scope.
-                results = await self.bot.GET(DatabaseQueries.GET_LOGS_BY_SERVER, (int(server),))
-                guild = self.bot.get_guild(int(server))
-                server_name = guild.name if guild else f"Server {server}"
+                results = await self.bot.GET(DatabaseQueries.GET_LEADERBOARD_BY_SERVER, (server_id,))
                 filter_description = f"for **{server_name}** (all time)"
             else:
                 # All-time, all servers.
-                results = await self.bot.GET(DatabaseQueries.GET_ALL_LOGS)
+                results = await self.bot.GET(DatabaseQueries.GET_LEADERBOARD_ALL)
                 filter_description = "(all time, all servers)"
 
             if not results:
@@ -1190,27 +1278,21 @@ class VNUserCommands(commands.Cog):
                 await interaction.followup.send(f"No reading logs found{filter_msg}.")
                 return
 
-            # Build leaderboard. _aggregate_leaderboard_rows centralizes the
-            # points + completions bucketing and the username resolution so
-            # the season-nav button handler can share it without drift.
-            sorted_entries = await _aggregate_leaderboard_rows(self.bot, results)
+            # Points + completions are summed and ranked in SQL;
+            # _leaderboard_entries only attaches usernames, shared with the
+            # season-nav button handler so the two can't drift.
+            sorted_entries = await _leaderboard_entries(self.bot, results)
 
             # Build a concrete period_label for the embed header.
             if season_months is not None and server:
-                guild = self.bot.get_guild(int(server))
-                server_name = guild.name if guild else f"Server {server}"
                 period_label = f"{season_label} · {server_name}"
             elif season_months is not None:
                 period_label = season_label
             elif month and server:
-                guild = self.bot.get_guild(int(server))
-                server_name = guild.name if guild else f"Server {server}"
                 period_label = f"{month} · {server_name}"
             elif month:
                 period_label = month
             elif server:
-                guild = self.bot.get_guild(int(server))
-                server_name = guild.name if guild else f"Server {server}"
                 period_label = f"All-Time · {server_name}"
             else:
                 period_label = "All-Time"
@@ -1231,7 +1313,7 @@ class VNUserCommands(commands.Cog):
                     bot=self.bot,
                     season_value=season_value,
                     season_year=season_year,
-                    server_id=int(server) if server else None,
+                    server_id=server_id,
                 )
             else:
                 view = LeaderboardView(
@@ -1242,7 +1324,7 @@ class VNUserCommands(commands.Cog):
                     is_default_season=using_default_season,
                 )
 
-            embed = view.create_embed()
+            embed = view.current_page_embed()
             await interaction.followup.send(embed=embed, view=view)
 
         except Exception as e:
@@ -1322,14 +1404,14 @@ class VNUserCommands(commands.Cog):
 
         if season_months is not None:
             results = await self.bot.GET(
-                DatabaseQueries.GET_LOGS_BY_SEASON, tuple(season_months)
+                DatabaseQueries.GET_SERVER_STANDINGS_BY_SEASON, tuple(season_months)
             )
             empty_msg = f"No reading logs found for {period_label}."
         elif month:
-            results = await self.bot.GET(DatabaseQueries.GET_LOGS_BY_MONTH, (month,))
+            results = await self.bot.GET(DatabaseQueries.GET_SERVER_STANDINGS_BY_MONTH, (month,))
             empty_msg = f"No reading logs found for {month}."
         else:
-            results = await self.bot.GET(DatabaseQueries.GET_ALL_LOGS)
+            results = await self.bot.GET(DatabaseQueries.GET_SERVER_STANDINGS_ALL)
             empty_msg = "No reading logs found."
 
         if not results:
@@ -1345,7 +1427,7 @@ class VNUserCommands(commands.Cog):
 
         if season_value_for_nav is not None and season_year_for_nav is not None:
             view = SeasonNavServerStandingsView(
-                self.bot, season_value_for_nav, season_year_for_nav,
+                self.bot, season_value_for_nav, season_year_for_nav, embed,
             )
             await interaction.followup.send(embed=embed, view=view)
         else:
@@ -1494,20 +1576,20 @@ class VNUserCommands(commands.Cog):
                 tasks = {}
                 tasks["cs_global"] = _user_rank_in(
                     self.bot, user.id,
-                    DatabaseQueries.GET_LOGS_BY_SEASON, tuple(season_months),
+                    DatabaseQueries.GET_LEADERBOARD_BY_SEASON, tuple(season_months),
                 )
                 tasks["at_global"] = _user_rank_in(
-                    self.bot, user.id, DatabaseQueries.GET_ALL_LOGS, (),
+                    self.bot, user.id, DatabaseQueries.GET_LEADERBOARD_ALL, (),
                 )
                 if guild_id is not None:
                     tasks["cs_server"] = _user_rank_in(
                         self.bot, user.id,
-                        DatabaseQueries.GET_LOGS_BY_SEASON_AND_SERVER,
+                        DatabaseQueries.GET_LEADERBOARD_BY_SEASON_AND_SERVER,
                         (*season_months, guild_id),
                     )
                     tasks["at_server"] = _user_rank_in(
                         self.bot, user.id,
-                        DatabaseQueries.GET_LOGS_BY_SERVER, (guild_id,),
+                        DatabaseQueries.GET_LEADERBOARD_BY_SERVER, (guild_id,),
                     )
 
                 results = await asyncio.gather(*tasks.values(), return_exceptions=True)
@@ -1602,73 +1684,33 @@ class VNUserCommands(commands.Cog):
         if user is None:
             user = interaction.user
 
-        results = await self.bot.GET(DatabaseQueries.GET_USER_LOGS, (user.id,))
-        if not results:
+        total_result = await self.bot.GET_ONE(DatabaseQueries.COUNT_USER_LOGS, (user.id,))
+        total = total_result[0] if total_result else 0
+        if not total:
             await interaction.followup.send(f"No reading logs found for {user.name}.")
             return
 
-        # Process logs into formatted strings
-        log_entries = []
-        for row in results:
-            (
-                log_id,
-                user_id,
-                vndb_id,
-                user_rating,
-                reward_reason,
-                reward_month,
-                points,
-                comment,
-                logged_in_guild,
-            ) = row
-
-            if vndb_id:
-                vn_info: VN_Entry = await from_vndb_id(self.bot, vndb_id)
-                display_comment = comment or 'No comment provided.'
-
-                if vn_info:
-                    link = await vn_info.get_vndb_link()
-                    # Prioritize Japanese title, fallback to English title, or generic text if both are empty
-                    display_title = vn_info.title_ja or vn_info.title_en or "View on VNDB"
-                    log_entry = (
-                        f"`#{log_id}` **{reward_month}**: [{display_title}]({link}) - {points}点 ({reward_reason})\n"
-                        f"Comment: {display_comment} | Rating: {user_rating or 'No rating provided.'}/5"
-                    )
-                else:
-                    # VN info failed to load - show vndb_id as fallback
-                    log_entry = (
-                        f"`#{log_id}` **{reward_month}**: {vndb_id} - {points}点 ({reward_reason})\n"
-                        f"Comment: {display_comment} | Rating: {user_rating or 'No rating provided.'}/5"
-                    )
-            else:
-                # Display full comment for non-VN entries too
-                display_comment = comment or 'No comment provided.'
-
-                log_entry = (
-                    f"`#{log_id}` **{reward_month}**: No VN specified - {points}点 ({reward_reason})\n"
-                    f"Comment: {display_comment}"
-                )
-
-            log_entries.append(log_entry)
-
-        # Create paginated view for logs (5 per page)
-        combined_description = "\n\n".join(log_entries)
+        # Paginated view for logs (5 per page); only the first page is read now.
+        view = ReadingLogsView(self.bot, user, total, per_page=5)
+        log_entries = await view.load_page()
+        # Length of the entries joined with "\n\n", without building the
+        # string unless the single-embed path below sends it.
+        combined_length = sum(map(len, log_entries)) + 2 * max(0, len(log_entries) - 1)
         
         # If we have 5 or fewer logs AND the combined description fits in Discord's limit, show all at once
-        if len(log_entries) <= 5 and len(combined_description) <= 4090:
+        if total <= 5 and combined_length <= 4090:
             # Show all logs without pagination
             embed = discord.Embed(
                 title=f"📚 Reading Logs for {user.name}", color=discord.Color.blue()
             )
             embed.set_author(name=user.name, icon_url=user.display_avatar.url)
 
-            embed.description = combined_description
-            embed.set_footer(text=f"{len(log_entries)} total logs")
+            embed.description = "\n\n".join(log_entries)
+            embed.set_footer(text=f"{total} total logs")
             await interaction.followup.send(embed=embed)
         else:
             # Use pagination for more than 5 logs OR if description is too long
-            view = ReadingLogsView(log_entries, user, per_page=5)
-            embed = view.create_embed()
+            embed = view.current_page_embed()
             await interaction.followup.send(embed=embed, view=view)
 
     @app_commands.command(name="manage_reward_points", description="[MANAGER] Reward user with points.")
@@ -1752,7 +1794,7 @@ class VNUserCommands(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         try:
             await validate_user_permission(interaction)
-            await validate_rating_input(rating)
+            validate_rating_input(rating)
 
             vndb_id = await resolve_vn_from_input(title)
             if not vndb_id:
@@ -1771,8 +1813,7 @@ class VNUserCommands(commands.Cog):
             # Resolve reward_month (default: current). validate_month_input
             # raises ValidationError on bad format, which the outer catch
             # translates to a friendly message.
-            from lib.utils import validate_month_input
-            effective_month = await validate_month_input(interaction, reward_month) \
+            effective_month = validate_month_input(interaction, reward_month) \
                 if reward_month else get_current_month()
 
             # Reject same-month duplicates only. The same VN can be re-logged
@@ -1817,7 +1858,7 @@ class VNUserCommands(commands.Cog):
                     }.get(entry_status or "monthly", "Monthly")
                     reward_reason = f"As {kind_label} VN (admin backfill)"
                 else:
-                    reward_points = await vn_info.get_points_not_monthly()
+                    reward_points = vn_info.points_not_monthly
                     reward_reason = "As Normal VN (admin backfill)"
             else:
                 reward_points = int(points)
@@ -1828,7 +1869,7 @@ class VNUserCommands(commands.Cog):
             # idempotent — admin re-running the same /manage_log
             # against an already-logged month resolves to a no-op
             # instead of stacking duplicate rows.
-            log_id = await self.bot.RUN_RETURNING_ID(
+            inserted = await self.bot.RUN_RETURNING(
                 DatabaseQueries.ADD_READING_LOG_OR_IGNORE,
                 (
                     member.id,
@@ -1841,7 +1882,7 @@ class VNUserCommands(commands.Cog):
                     interaction.guild.id,
                 ),
             )
-            if not log_id:
+            if not inserted:
                 await interaction.followup.send(
                     f"ℹ️ {member.mention} already has a log for this VN in "
                     f"**{effective_month}** — nothing to add. (Re-reads in a "
@@ -1849,6 +1890,7 @@ class VNUserCommands(commands.Cog):
                     allowed_mentions=discord.AllowedMentions.none(),
                 )
                 return
+            log_id = inserted[0][0]
 
             _log.info(
                 "Admin %s (%s) backfilled log #%s for user %s (%s) — "
@@ -1933,14 +1975,11 @@ class VNUserCommands(commands.Cog):
         display_comment = truncate_text(comment or 'No comment provided.', 500)
 
         try:
-            await interaction.followup.send(
-                f"✅ Deleted log #{log_id} for <@{user_id}>:\n"
-                f"**Title:** {display_title}\n"
-                f"**Reward Reason:** {display_reason}\n"
-                f"**Reward Month:** {reward_month}\n"
-                f"**Points:** {points}\n"
-                f"**Comment:** {display_comment}"
-            )
+            await interaction.followup.send(_DELETED_LOG_TEMPLATE.format(
+                log_id=log_id, user_id=user_id, title=display_title,
+                reason=display_reason, month=reward_month, points=points,
+                comment=display_comment,
+            ))
         except discord.HTTPException as e:
             if e.code == 50035:  # Invalid Form Body (message too long)
                 # Fallback with minimal information
@@ -2072,8 +2111,11 @@ class VNUserCommands(commands.Cog):
                     "temporarily unreachable — try again in a moment.",
                 )
 
-            # Get all ratings for this VN
-            ratings = await self.bot.GET(DatabaseQueries.GET_ALL_VN_RATINGS, (vn_info.vndb_id,))
+            # Get all ratings for this VN, plus the average/count aggregate
+            ratings, rating_stats = await asyncio.gather(
+                self.bot.GET(DatabaseQueries.GET_ALL_VN_RATINGS, (vn_info.vndb_id,)),
+                self.bot.GET_ONE(DatabaseQueries.GET_VN_RATING_STATS, (vn_info.vndb_id,)),
+            )
 
             if not ratings:
                 display_title = vn_info.title_ja or vn_info.title_en or vn_info.vndb_id
@@ -2085,21 +2127,16 @@ class VNUserCommands(commands.Cog):
             # — each is a distinct rating event. Pre-count rows per user so we
             # only annotate the month when there's ambiguity (single-rating
             # users don't need the month tag cluttering their entry).
-            user_rating_counts: dict[int, int] = {}
-            for uid, *_ in ratings:
-                user_rating_counts[uid] = user_rating_counts.get(uid, 0) + 1
+            user_rating_counts = Counter(uid for uid, *_ in ratings)
 
-            rating_entries = []
-            total_ratings = 0
-            total_score = 0
+            # Resolve each rater's name once, in one batch, before formatting.
+            user_names = await get_usernames_db(self.bot, user_rating_counts)
 
+            rating_entries = []
             for user_id, user_rating, comment, reward_month in ratings:
-                user_name = await get_username_db(self.bot, user_id)
-
-                total_ratings += 1
-                total_score += user_rating
+                user_name = user_names[user_id]
 
-                stars = "⭐" * user_rating
+                stars = RATING_STARS[user_rating]
                 month_tag = (
                     f" · *{reward_month}*"
                     if user_rating_counts.get(user_id, 1) > 1
@@ -2115,8 +2152,8 @@ class VNUserCommands(commands.Cog):
 
                 rating_entries.append(rating_entry)
 
-            # Calculate average rating
-            average_rating = total_score / total_ratings if total_ratings > 0 else 0
+            average_rating, total_ratings = rating_stats
+            average_rating = average_rating or 0
 
             jiten_deck_id: Optional[int] = None
             jiten_data = None
@@ -2147,8 +2184,7 @@ class VNUserCommands(commands.Cog):
                 )
                 # Defensive cap — a few full-cap comments stacked together can
                 # exceed Discord's 4096-char description limit.
-                if len(description) > MAX_EMBED_DESCRIPTION - EMBED_DESCRIPTION_BUFFER:
-                    description = description[:MAX_EMBED_DESCRIPTION - EMBED_DESCRIPTION_BUFFER - 3] + "..."
+                description = truncate_text(description, EMBED_DESCRIPTION_LIMIT)
                 embed = create_base_embed(
                     title=f"⭐ User Ratings for **{display_title}**",
                     description=description,
@@ -2169,7 +2205,7 @@ class VNUserCommands(commands.Cog):
                     rating_entries, display_title, average_rating, total_ratings,
                     per_page=5, thumbnail_url=display_thumb,
                 )
-                embed = view.create_embed()
+                embed = view.current_page_embed()
 
                 # Stack VNDB / jiten link buttons alongside the pagination row.
                 view.add_item(discord.ui.Button(
@@ -2,18 +2,179 @@
 Shared autocomplete functions for the VN Club Bot.
 """
 
-import json
+import asyncio
+import re
 import discord
 import logging
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from lib.utils import DatabaseQueries
+from lib.vndb_api import from_vndb_id
 from lib.vndb_search import search_visual_novel, create_autocomplete_value, parse_autocomplete_value
 
 logger = logging.getLogger(__name__)
 
 HELP_JSON_PATH = Path(__file__).resolve().parent.parent / "help_commands.json"
 
+_YEAR_MONTH_SHAPE_RE = re.compile(r"\d{4}-\d{2}")
+
+# (help_data, entries): the VNUserCommands cog's ``_help_data`` list, read
+# off the event loop in its cog_load, and the (search_key, choice) pairs
+# built from it. Rebuilt only if the cog hands us a different list (a
+# cog reload); otherwise every keystroke reuses the same pairs.
+_help_entries: Optional[tuple] = None
+
+# Pool entries for vn_pool_autocomplete, as (monotonic_ts, index). The
+# pool changes a few times a month while keystrokes arrive several times a
+# second, so entries are reused for the TTL and a refresh runs one query
+# no matter how many keystrokes are waiting on it. Pool edits call
+# forget_pool_autocomplete(); the generation counter keeps a refresh that
+# raced an edit from storing pre-edit entries.
+_POOL_ENTRIES_TTL_SECONDS = 60
+_pool_entries: Optional[tuple[float, tuple[list, list]]] = None
+_pool_entries_generation = 0
+_pool_entries_lock = asyncio.Lock()
+
+
+# Choices for month_autocomplete / server_autocomplete, keyed by query as
+# (monotonic_ts, [(search_key, choice), ...]). Both queries scan
+# reading_logs but only grow when a new month starts or a new guild logs
+# its first VN, so a short TTL is enough and no write path needs to
+# invalidate them. Choices are built at refresh, like the pool entries,
+# so keystrokes only filter and reuse them.
+_DISTINCT_CHOICES_TTL_SECONDS = 60
+_distinct_choices: dict[str, tuple[float, list]] = {}
+
+
+def _index_month_rows(bot, rows) -> list[tuple[str, discord.app_commands.Choice]]:
+    # reward_month is always YYYY-MM, so it's its own search key.
+    return [
+        (month, discord.app_commands.Choice(name=month, value=month))
+        for (month,) in rows if month
+    ]
+
+
+def _index_server_rows(bot, rows) -> list[tuple[str, discord.app_commands.Choice]]:
+    entries = []
+    for (guild_id,) in rows:
+        guild = bot.get_guild(guild_id)
+        guild_name = guild.name if guild else f"Unknown Server ({guild_id})"
+        entries.append((
+            guild_name.lower(),
+            discord.app_commands.Choice(name=guild_name, value=str(guild_id)),
+        ))
+    return entries
+
+
+async def _get_distinct_choices(bot, query: str, index) -> list:
+    cached = _distinct_choices.get(query)
+    if cached is not None and (time.monotonic() - cached[0]) < _DISTINCT_CHOICES_TTL_SECONDS:
+        return cached[1]
+    entries = index(bot, await bot.GET(query))
+    _distinct_choices[query] = (time.monotonic(), entries)
+    return entries
+
+
+# VNDB search results for vn_autocomplete, keyed by lowercased query as
+# (monotonic_ts, results) in LRU order. Each keystroke is an HTTP round
+# trip, and backspacing or several people typing the same title repeat
+# queries within seconds. Empty results aren't stored because
+# search_visual_novel also returns [] when VNDB errors out.
+_VNDB_SEARCH_TTL_SECONDS = 120
+_VNDB_SEARCH_CACHE_CAP = 512
+_vndb_search_results: "OrderedDict[str, tuple[float, list]]" = OrderedDict()
+# Searches currently on the wire, so identical concurrent keystrokes
+# share one request instead of each sending their own.
+_vndb_search_inflight: dict[str, asyncio.Task] = {}
+
+
+def _store_vndb_search(key: str, task: asyncio.Task) -> None:
+    _vndb_search_inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    results = task.result()
+    if results:
+        _vndb_search_results[key] = (time.monotonic(), results)
+        _vndb_search_results.move_to_end(key)
+        while len(_vndb_search_results) > _VNDB_SEARCH_CACHE_CAP:
+            _vndb_search_results.popitem(last=False)
+
+
+async def _search_vndb_cached(query: str) -> list:
+    key = query.lower()
+    cached = _vndb_search_results.get(key)
+    if cached is not None and (time.monotonic() - cached[0]) < _VNDB_SEARCH_TTL_SECONDS:
+        _vndb_search_results.move_to_end(key)
+        return cached[1]
+    task = _vndb_search_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(search_visual_novel(query, limit=25))
+        _vndb_search_inflight[key] = task
+        task.add_done_callback(lambda t: _store_vndb_search(key, t))
+    # Shielded so one caller timing out doesn't cancel the search for
+    # everyone else waiting on it.
+    return await asyncio.shield(task)
+
+
+def forget_pool_autocomplete() -> None:
+    """Drop the cached pool entries so the next keystroke re-reads vn_titles."""
+    global _pool_entries, _pool_entries_generation
+    _pool_entries = None
+    _pool_entries_generation += 1
+
+
+def _fold(text: str) -> str:
+    """Normalize for case-insensitive title matching. NFKC folds
+    full-width Latin and half-width kana onto their usual forms, and
+    casefold handles what lower() misses (e.g. ß)."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _index_pool_rows(rows) -> tuple[list, list]:
+    """VN_AUTOCOMPLETE rows -> ``(recent, by_key)``, two lists of the same
+    ``(search_key, choice)`` pairs: newest-first as queried, and sorted
+    by ``search_key`` for prefix lookups.
+
+    ``search_key`` is the folded title and id joined by a NUL, so one
+    ``query in search_key`` test matches either field without a query
+    ever spanning both, and a key prefix is always a title prefix. Keys
+    and the truncated Choice labels are built once per refresh.
+    """
+    entries = []
+    for vndb_id, title_ja in rows:
+        display_title = title_ja or vndb_id
+        label = f"{display_title} ({vndb_id})"
+        if len(label) > 100:
+            label = label[:97] + "..."
+        entries.append((
+            _fold(f"{display_title}\0{vndb_id}"),
+            discord.app_commands.Choice(name=label, value=vndb_id),
+        ))
+    return entries, sorted(entries, key=itemgetter(0))
+
+
+async def _get_pool_entries(bot) -> tuple[list, list]:
+    global _pool_entries
+    cached = _pool_entries
+    if cached is not None and (time.monotonic() - cached[0]) < _POOL_ENTRIES_TTL_SECONDS:
+        return cached[1]
+    async with _pool_entries_lock:
+        cached = _pool_entries
+        if cached is not None and (time.monotonic() - cached[0]) < _POOL_ENTRIES_TTL_SECONDS:
+            return cached[1]
+        generation = _pool_entries_generation
+        entries = _index_pool_rows(await bot.GET(DatabaseQueries.VN_AUTOCOMPLETE))
+        if generation == _pool_entries_generation:
+            _pool_entries = (time.monotonic(), entries)
+        return entries
+
 
 async def vn_autocomplete(interaction: discord.Interaction, current: str) -> List[discord.app_commands.Choice]:
     """
@@ -28,28 +189,27 @@ async def vn_autocomplete(interaction: discord.Interaction, current: str) -> Lis
     """
     query = (current or "").strip()
 
-    # Handle already-selected autocomplete value (user clicked back on the field)
-    if query.startswith("${") and query.endswith("}"):
-        parsed = parse_autocomplete_value(query)
-        if parsed:
-            vndb_id, field, source = parsed
-            # Try to get VN info from cache to show the title
-            try:
-                from lib.vndb_api import from_vndb_id
-                vn_info = await from_vndb_id(interaction.client, vndb_id)
-                if vn_info:
-                    display_title = vn_info.title_ja or vn_info.title_en or vndb_id
-                    return [discord.app_commands.Choice(name=display_title, value=query)]
-            except Exception:
-                pass
-            # Fallback: return the raw ID as a choice
-            return [discord.app_commands.Choice(name=f"Selected: {vndb_id}", value=query)]
+    # Handle already-selected autocomplete value (user clicked back on the
+    # field). parse_autocomplete_value does the ${...} shape check itself.
+    parsed = parse_autocomplete_value(query)
+    if parsed:
+        vndb_id, field, source = parsed
+        # Try to get VN info from cache to show the title
+        try:
+            vn_info = await from_vndb_id(interaction.client, vndb_id)
+            if vn_info:
+                display_title = vn_info.title_ja or vn_info.title_en or vndb_id
+                return [discord.app_commands.Choice(name=display_title, value=query)]
+        except Exception:
+            pass
+        # Fallback: return the raw ID as a choice
+        return [discord.app_commands.Choice(name=f"Selected: {vndb_id}", value=query)]
 
     if len(query) < 2:
         return []
 
     try:
-        results = await search_visual_novel(query, limit=25)
+        results = await _search_vndb_cached(query)
     except Exception as exc:
         logger.warning("VNDB autocomplete failed for '%s': %s", query, exc)
         return []
@@ -129,9 +289,7 @@ async def user_logs_autocomplete(interaction: discord.Interaction, current: str)
             return []
 
         choices = []
-        for log_id, vndb_id, reward_month, reward_reason, points, vn_title in results[:25]:
-            # Use VN title if available, otherwise show reward reason for non-VN logs
-            display_name = vn_title or reward_reason or "Unknown"
+        for log_id, reward_month, points, display_name in results:
             label = f"#{log_id} | {display_name} ({reward_month}, {points}点)"
             # Truncate if needed (Discord limit is 100 chars)
             if len(label) > 100:
@@ -155,7 +313,6 @@ def _month_window(back: int, forward: int) -> List[str]:
     common: ``/manage_log reward_month:``) get the closest hit
     immediately above the current month.
     """
-    from datetime import datetime
     now = datetime.now()
     cur_y, cur_m = now.year, now.month
 
@@ -176,14 +333,12 @@ def _month_picker_finish(
     needle: str, suggestions: List[str],
 ) -> List[discord.app_commands.Choice[str]]:
     """Shared filter + echo + cap logic for the month-picker variants below."""
-    import re
-    from datetime import datetime
     if needle:
         suggestions = [m for m in suggestions if needle in m]
 
     # Echo a typed-but-not-suggested valid YYYY-MM at the top so admins can
     # pick e.g. 2025-09 even though it's outside the default window.
-    if re.fullmatch(r"\d{4}-\d{2}", needle) and needle not in suggestions:
+    if _YEAR_MONTH_SHAPE_RE.fullmatch(needle) and needle not in suggestions:
         try:
             datetime.strptime(needle, "%Y-%m")
             suggestions.insert(0, needle)
@@ -252,6 +407,15 @@ _MONTH_NAMES = (
     "January", "February", "March", "April", "May", "June",
     "July", "August", "September", "October", "November", "December",
 )
+# (lowercased label, month number as text, choice) for month_int_autocomplete.
+_MONTH_INT_ENTRIES = tuple(
+    (
+        f"{i} — {name}".lower(),
+        str(i),
+        discord.app_commands.Choice(name=f"{i} — {name}", value=i),
+    )
+    for i, name in enumerate(_MONTH_NAMES, start=1)
+)
 
 
 async def month_int_autocomplete(
@@ -261,13 +425,10 @@ async def month_int_autocomplete(
     as `int` representing a month-of-year (e.g. ``/pool month:``).
     """
     needle = (current or "").strip().lower()
-    choices: list[discord.app_commands.Choice[int]] = []
-    for i, name in enumerate(_MONTH_NAMES, start=1):
-        label = f"{i} — {name}"
-        if needle and needle not in label.lower() and needle != str(i):
-            continue
-        choices.append(discord.app_commands.Choice(name=label, value=i))
-    return choices[:25]
+    return [
+        choice for label, number, choice in _MONTH_INT_ENTRIES
+        if not needle or needle in label or needle == number
+    ]
 
 
 async def year_autocomplete(
@@ -277,7 +438,6 @@ async def year_autocomplete(
     leaderboards. Echoes a typed 4-digit year not in the suggested
     range so far-past or far-future years are still selectable.
     """
-    from datetime import datetime
     needle = (current or "").strip()
     cur = datetime.now().year
     years = [cur, cur + 1, cur - 1, cur + 2, cur - 2, cur + 3, cur - 3]
@@ -308,29 +468,14 @@ async def month_autocomplete(interaction: discord.Interaction, current: str) ->
         List of choices for autocomplete
     """
     try:
-        # Get distinct months from reading logs
-        results = await interaction.client.GET(DatabaseQueries.GET_DISTINCT_MONTHS)
-        
-        if not results:
-            return []
-
-        months = [month[0] for month in results if month[0]]
-        
-        if not current:
-            return [
-                discord.app_commands.Choice(name=month, value=month)
-                for month in months[:25]
-            ]
-        else:
-            # Filter by current input
-            filtered_months = [
-                month for month in months
-                if current.lower() in month.lower()
-            ]
-            return [
-                discord.app_commands.Choice(name=month, value=month)
-                for month in filtered_months[:25]
-            ]
+        # Distinct months from reading logs, newest first
+        entries = await _get_distinct_choices(
+            interaction.client, DatabaseQueries.GET_DISTINCT_MONTHS, _index_month_rows,
+        )
+        needle = (current or "").lower()
+        return list(islice(
+            (choice for month, choice in entries if needle in month), 25,
+        ))
     except Exception as exc:
         logger.warning("month autocomplete failed: %s", exc)
         return []
@@ -378,21 +523,14 @@ async def server_autocomplete(interaction: discord.Interaction, current: str) ->
         List of choices for autocomplete
     """
     try:
-        # Get distinct guilds from reading logs
-        results = await interaction.client.GET(DatabaseQueries.GET_DISTINCT_SERVERS)
-
-        if not results:
-            return []
-
-        choices = []
-        for (guild_id,) in results:
-            guild = interaction.client.get_guild(guild_id)
-            guild_name = guild.name if guild else f"Unknown Server ({guild_id})"
-
-            if not current or current.lower() in guild_name.lower():
-                choices.append(discord.app_commands.Choice(name=guild_name, value=str(guild_id)))
-
-        return choices[:25]
+        # Distinct guilds from reading logs
+        entries = await _get_distinct_choices(
+            interaction.client, DatabaseQueries.GET_DISTINCT_SERVERS, _index_server_rows,
+        )
+        needle = (current or "").lower()
+        return list(islice(
+            (choice for guild_name, choice in entries if needle in guild_name), 25,
+        ))
     except Exception as exc:
         logger.warning("server autocomplete failed: %s", exc)
         return []
@@ -410,65 +548,81 @@ async def vn_pool_autocomplete(interaction: discord.Interaction, current: str) -
         List of choices for autocomplete (VNs already in the database)
     """
     try:
-        # Get all VN titles from the pool with their cached info
-        results = await interaction.client.GET(DatabaseQueries.VN_AUTOCOMPLETE)
+        # All pool VNs with their cached info, newest and title-sorted
+        recent, by_key = await _get_pool_entries(interaction.client)
 
-        if not results:
+        if not recent:
             return []
 
-        query = (current or "").strip().lower()
-        choices = []
-
-        for vndb_id, title_ja in results:
-            display_title = title_ja or vndb_id
-
-            # Filter by current input if provided
-            if query and query not in display_title.lower() and query not in vndb_id.lower():
-                continue
+        query = _fold((current or "").strip())
+        if not query:
+            return [choice for _, choice in recent[:25]]
 
-            label = f"{display_title} ({vndb_id})"
-            if len(label) > 100:
-                label = label[:97] + "..."
+        # Title-prefix matches first, straight out of the sorted keys:
+        # bisect to the first key >= query and walk while keys still
+        # start with it.
+        choices = []
+        for i in range(bisect_left(by_key, query, key=itemgetter(0)), len(by_key)):
+            search_key, choice = by_key[i]
+            if not search_key.startswith(query) or len(choices) >= 25:
+                break
+            choices.append(choice)
 
-            choices.append(discord.app_commands.Choice(name=label, value=vndb_id))
+        # Then other substring matches (mid-title or on the id), newest first.
+        if len(choices) < 25:
+            for search_key, choice in recent:
+                if query in search_key and not search_key.startswith(query):
+                    choices.append(choice)
+                    if len(choices) >= 25:
+                        break
 
-        return choices[:25]
+        return choices
     except Exception as exc:
         logger.warning("vn_pool autocomplete failed: %s", exc)
         return []
 
 
+def _index_help_commands(commands) -> List[tuple]:
+    """help_commands.json entries -> ``(search_key, choice)``, with the
+    name and short description lowercased and NUL-joined like the pool
+    entries."""
+    entries = []
+    for cmd in commands:
+        name = cmd.get("name") or ""
+        short = cmd.get("short_description") or ""
+        # Display label: `name — short_description`, truncated to Discord's 100-char limit.
+        label = f"{name} — {short}" if short else name
+        if len(label) > 100:
+            label = label[:99] + "…"
+        entries.append((
+            f"{name}\0{short}".lower(),
+            discord.app_commands.Choice(name=label, value=name.lstrip("/")),
+        ))
+    return entries
+
+
 async def help_command_autocomplete(interaction: discord.Interaction, current: str) -> List[discord.app_commands.Choice]:
     """Autocomplete for the /help `command` argument.
 
     Suggests command names from help_commands.json. Matches `current`
     case-insensitively against name and short_description so a user typing
     "log" surfaces /logs / /log_undo / /log_edit, and "rank" surfaces
-    /leaderboard via its short description.
+    /leaderboard via its short description. Reads the command list the
+    VNUserCommands cog already loaded rather than touching the file here.
     """
-    try:
-        with open(HELP_JSON_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        entries = data.get("commands", [])
-    except Exception as e:  # noqa: BLE001
-        logger.warning("help autocomplete: failed to load %s: %s", HELP_JSON_PATH, e)
+    global _help_entries
+    cog = interaction.client.get_cog("VNUserCommands")
+    help_data = getattr(cog, "_help_data", None)
+    if help_data is None:
         return []
+    if _help_entries is None or _help_entries[0] is not help_data:
+        _help_entries = (help_data, _index_help_commands(help_data))
+    entries = _help_entries[1]
 
     needle = (current or "").strip().lower().lstrip("/")
-    choices: List[discord.app_commands.Choice[str]] = []
-    for cmd in entries:
-        name = cmd.get("name") or ""
-        short = cmd.get("short_description") or ""
-        if needle and needle not in name.lower() and needle not in short.lower():
-            continue
-        # Display label: `name — short_description`, truncated to Discord's 100-char limit.
-        label = f"{name} — {short}" if short else name
-        if len(label) > 100:
-            label = label[:99] + "…"
-        choices.append(discord.app_commands.Choice(name=label, value=name.lstrip("/")))
-        if len(choices) >= 25:
-            break
-    return choices
+    return list(islice(
+        (choice for search_key, choice in entries if needle in search_key), 25,
+    ))
 
 
 # Rating choices for consistent use across commands
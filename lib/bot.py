@@ -1,13 +1,27 @@
 import os
 import sys
 import time
+import asyncio
 import discord
 import aiosqlite
 import logging
+from contextlib import asynccontextmanager
 from discord.ext import commands, tasks
 
 _log = logging.getLogger(__name__)
 
+# Size of sqlite3's per-connection prepared-statement cache (keyed by SQL
+# text). The DatabaseQueries constants are reused verbatim across calls, so
+# with one long-lived connection a repeat query skips the parse/plan step.
+# Python's default (128) is tight once autocomplete, cycle and banner
+# queries are all in rotation.
+_STATEMENT_CACHE_SIZE = 256
+
+# Read-only connections backing GET/GET_ONE. With the database in WAL mode
+# readers never block on the writer (or each other), so a slash command's
+# SELECT doesn't queue behind the role-reward scan or a cycle close.
+_READER_POOL_SIZE = 4
+
 
 class VNClubBot(commands.Bot):
     def __init__(self, cog_folder="cogs", path_to_db="data/db.sqlite3"):
@@ -49,6 +63,18 @@ class VNClubBot(commands.Bot):
         # Healthcheck (Dockerfile) reads this file's mtime; match main.py's default.
         self._health_file = os.getenv("LOG_FILE", "hikaru_bot.log")
 
+        # One long-lived writer connection, opened lazily. Statement
+        # caches are per connection, so the old connect-per-call pattern
+        # re-parsed every query. The lock serializes access so a
+        # RUN_TRANSACTION can't interleave with another caller's
+        # statements on the shared connection.
+        self._db: aiosqlite.Connection | None = None
+        self._db_lock = asyncio.Lock()
+        # Reader pool: idle connections wait in the queue; up to
+        # _READER_POOL_SIZE are opened on demand.
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._reader_count = 0
+
         db_directory = os.path.dirname(self.path_to_db)
         if not os.path.exists(db_directory):
             os.makedirs(db_directory)
@@ -114,6 +140,9 @@ class VNClubBot(commands.Bot):
 
         cogs = [cog for cog in os.listdir(self.cog_folder) if cog.endswith(".py")]
 
+        # Loaded one at a time on purpose: every cog_load's DB setup
+        # serializes on the writer lock anyway, and a serial loop keeps
+        # command registration order deterministic between boots.
         loaded: list[str] = []
         for cog in cogs:
             cog = f"{self.cog_folder}.{cog[:-3]}"
@@ -122,19 +151,110 @@ class VNClubBot(commands.Bot):
             loaded.append(cog)
         _log.info("Startup ready: migrations applied, %d cog(s) loaded", len(loaded))
 
+    async def _get_db(self) -> aiosqlite.Connection:
+        """Return the shared connection, opening it on first use. Callers
+        must hold ``_db_lock``."""
+        if self._db is None:
+            db = await aiosqlite.connect(
+                self.path_to_db, cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            # WAL is persistent in the file; setting it on every open is a
+            # cheap no-op once applied. NORMAL sync is the recommended
+            # pairing: still crash-safe, without an fsync per commit.
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
+            self._db = db
+        return self._db
+
+    @asynccontextmanager
+    async def _reader(self):
+        """Borrow a pooled read-only connection for one query."""
+        try:
+            db = self._idle_readers.get_nowait()
+        except asyncio.QueueEmpty:
+            if self._reader_count < _READER_POOL_SIZE:
+                self._reader_count += 1
+                try:
+                    # Make sure the writer has switched the file to WAL
+                    # before any reader attaches.
+                    async with self._db_lock:
+                        await self._get_db()
+                    db = await aiosqlite.connect(
+                        self.path_to_db, cached_statements=_STATEMENT_CACHE_SIZE,
+                    )
+                    await db.execute("PRAGMA query_only=ON")
+                    # Leaderboard GROUP BY / ORDER BY sorts spill into temp
+                    # b-trees; keep those in memory rather than temp files.
+                    await db.execute("PRAGMA temp_store=MEMORY")
+                except Exception:
+                    self._reader_count -= 1
+                    raise
+            else:
+                db = await self._idle_readers.get()
+        try:
+            yield db
+        finally:
+            self._idle_readers.put_nowait(db)
+
+    async def close(self):
+        await super().close()
+        async with self._db_lock:
+            if self._db is not None:
+                await self._db.close()
+                self._db = None
+        while not self._idle_readers.empty():
+            await self._idle_readers.get_nowait().close()
+            self._reader_count -= 1
+
     async def RUN(self, query: str, params: tuple = ()):
-        async with aiosqlite.connect(self.path_to_db) as db:
-            await db.execute(query, params)
-            await db.commit()
-
-    async def RUN_RETURNING_ID(self, query: str, params: tuple = ()) -> int:
-        """Execute a query and return the last inserted row id."""
-        async with aiosqlite.connect(self.path_to_db) as db:
-            cursor = await db.execute(query, params)
-            new_id = cursor.lastrowid
-            await db.commit()
+        async with self._db_lock:
+            db = await self._get_db()
+            try:
+                await db.execute(query, params)
+                await db.commit()
+            except Exception:
+                # The connection outlives this call, so never leave a
+                # half-applied implicit transaction open on it.
+                await db.rollback()
+                raise
+
+    async def RUN_RETURNING_ID(self, query: str, params: tuple = ()) -> int | None:
+        """Execute a query and return the last inserted row id, or None if
+        it inserted nothing.
+
+        ``lastrowid`` alone can't be trusted for that: on this long-lived
+        connection an ignored ``INSERT OR IGNORE`` leaves it at the
+        previous insert's id. Prefer ``RUN_RETURNING`` with ``RETURNING
+        id`` for OR IGNORE inserts.
+        """
+        async with self._db_lock:
+            db = await self._get_db()
+            try:
+                async with db.execute(query, params) as cursor:
+                    new_id = cursor.lastrowid if cursor.rowcount else None
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
             return new_id
 
+    async def RUN_RETURNING(self, query: str, params: tuple = ()) -> list:
+        """Execute a write with a ``RETURNING`` clause and return its rows.
+
+        Lets a caller learn what an UPDATE/DELETE touched without a
+        separate SELECT before or after it.
+        """
+        async with self._db_lock:
+            db = await self._get_db()
+            try:
+                async with db.execute(query, params) as cursor:
+                    rows = await cursor.fetchall()
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+            return rows
+
     async def RUN_TRANSACTION(self, statements: list[tuple[str, tuple]]) -> None:
         """Execute multiple writes atomically in a single transaction.
 
@@ -143,7 +263,8 @@ class VNClubBot(commands.Bot):
         ``(query, params)``. On any failure, the whole transaction rolls back
         and the exception propagates.
         """
-        async with aiosqlite.connect(self.path_to_db) as db:
+        async with self._db_lock:
+            db = await self._get_db()
             try:
                 for query, params in statements:
                     await db.execute(query, params)
@@ -153,13 +274,25 @@ class VNClubBot(commands.Bot):
                 raise
 
     async def GET(self, query: str, params: tuple = ()):
-        async with aiosqlite.connect(self.path_to_db) as db:
+        async with self._reader() as db:
             async with db.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
                 return rows
 
+    async def ITER(self, query: str, params: tuple = ()):
+        """Yield a query's rows as they're read instead of collecting them
+        like ``GET``. For scans that fold rows into a small result.
+
+        Holds a pooled reader until the iteration ends, so consume it to
+        the end without awaiting Discord calls in the loop body.
+        """
+        async with self._reader() as db:
+            async with db.execute(query, params) as cursor:
+                async for row in cursor:
+                    yield row
+
     async def GET_ONE(self, query: str, params: tuple = ()):
-        async with aiosqlite.connect(self.path_to_db) as db:
+        async with self._reader() as db:
             async with db.execute(query, params) as cursor:
                 row = await cursor.fetchone()
                 return row
@@ -27,6 +27,10 @@
 
 import re
 
+_URL_TAG_RE = re.compile(r"\[url=(.*?)\](.*?)\[/url\]")
+_RELATIVE_MD_LINK_RE = re.compile(r"(\[[^\]]+\]\()(/[a-z]\d[\w./?#=&%-]*)(\))")
+_SPOILER_RE = re.compile(r"\[spoiler\](.*?)\[/spoiler\]", re.S)
+
 
 def _absolutize_vndb_url(url: str) -> str:
     """Promote a VNDB-relative URL to an absolute one. Discord only renders
@@ -46,15 +50,14 @@ def replace_url(text: str) -> str:
         url = _absolutize_vndb_url(m.group(1))
         label = m.group(2)
         return f"[{label}]({url})"
-    return re.sub(r"\[url=(.*?)\](.*?)\[/url\]", repl, text)
+    return _URL_TAG_RE.sub(repl, text)
 
 
 def replace_relative_md_links(text: str) -> str:
     """Catch already-markdown-formatted links with relative VNDB targets
     (e.g. `[Houzuki Enju](/c161706)`) and absolutize them. The VNDB API
     has been observed emitting these directly, in addition to BBCode."""
-    return re.sub(
-        r"(\[[^\]]+\]\()(/[a-z]\d[\w./?#=&%-]*)(\))",
+    return _RELATIVE_MD_LINK_RE.sub(
         lambda m: m.group(1) + _absolutize_vndb_url(m.group(2)) + m.group(3),
         text,
     )
@@ -62,7 +65,7 @@ def replace_relative_md_links(text: str) -> str:
 
 def replace_spoiler(text: str) -> str:
     # Convert [spoiler]TEXT[/spoiler] to ||TEXT||
-    return re.sub(r"\[spoiler\](.*?)\[/spoiler\]", r"||\1||", text, flags=re.S)
+    return _SPOILER_RE.sub(r"||\1||", text)
 
 
 # BBCode inline styles with a Discord markdown equivalent. [quote], [raw] and
@@ -70,18 +73,26 @@ def replace_spoiler(text: str) -> str:
 _SIMPLE_TAGS = {"b": "**", "i": "*", "u": "__", "s": "~~"}
 _TAG_NAMES = tuple(_SIMPLE_TAGS) + ("quote", "raw", "code")
 _ORPHAN_TAG_RE = re.compile(r"\[/?(?:%s)\]" % "|".join(_TAG_NAMES))
+# The simple styles in one alternation. The closer must name the same tag
+# as the opener, and each match's contents are rewritten recursively, so
+# nested tags come out as they would from one pass per tag while all four
+# styles share a single scan. [spoiler] keeps its own pass ahead of this
+# one so a spoiler body is masked even when a style tag overlaps it.
+_INLINE_TAG_RE = re.compile(
+    r"\[(%s)\](.*?)\[/\1\]" % "|".join(_SIMPLE_TAGS), re.S,
+)
 
 
-def replace_simple_tags(text: str) -> str:
-    """Convert VNDB inline styling BBCode into Discord markdown."""
-    for tag, marker in _SIMPLE_TAGS.items():
-        text = re.sub(
-            rf"\[{tag}\](.*?)\[/{tag}\]",
-            lambda m, marker=marker: f"{marker}{m.group(1)}{marker}",
-            text,
-            flags=re.S,
-        )
-    return text
+def _replace_inline_tag(m: re.Match) -> str:
+    marker = _SIMPLE_TAGS[m.group(1)]
+    return f"{marker}{_INLINE_TAG_RE.sub(_replace_inline_tag, m.group(2))}{marker}"
+
+
+def replace_inline_tags(text: str) -> str:
+    """Convert VNDB [spoiler] and inline styling BBCode into Discord
+    markdown."""
+    text = replace_spoiler(text)
+    return _INLINE_TAG_RE.sub(_replace_inline_tag, text)
 
 
 def strip_orphan_tags(text: str) -> str:
@@ -93,13 +104,17 @@ def strip_orphan_tags(text: str) -> str:
 def replace_bbcode(text: str) -> str:
     text = replace_url(text)
     text = replace_relative_md_links(text)
-    text = replace_spoiler(text)
-    text = replace_simple_tags(text)
+    text = replace_inline_tags(text)
     text = strip_orphan_tags(text)
     return text
 
 
 _MD_LINK_RE = re.compile(r"\[([^\[\]]*)\]\([^)\s]*\)")
+_URL_TAG_LABEL_RE = re.compile(r"\[url=[^\]]*\](.*?)\[/url\]", re.S)
+_MARKDOWN_MARKER_RE = re.compile(r"\|\||\*\*|__|~~|\*")
+_RUN_OF_BLANKS_RE = re.compile(r"[ \t]{2,}")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"[ \t]+([,.!?;:])")
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
 
 
 def to_plain_text(text: str) -> str:
@@ -108,15 +123,15 @@ def to_plain_text(text: str) -> str:
     ``||`` in the PNG. Spoiler *contents* are dropped rather than unmasked,
     since an image has no way to hide them.
     """
-    text = re.sub(r"\[spoiler\].*?\[/spoiler\]", "", text, flags=re.S)
-    text = re.sub(r"\[url=[^\]]*\](.*?)\[/url\]", r"\1", text, flags=re.S)
+    text = _SPOILER_RE.sub("", text)
+    text = _URL_TAG_LABEL_RE.sub(r"\1", text)
     text = _MD_LINK_RE.sub(r"\1", text)
     text = strip_orphan_tags(text)
-    text = re.sub(r"\|\||\*\*|__|~~|\*", "", text)
-    text = re.sub(r"[ \t]{2,}", " ", text)
+    text = _MARKDOWN_MARKER_RE.sub("", text)
+    text = _RUN_OF_BLANKS_RE.sub(" ", text)
     # Removing a spoiler mid-sentence leaves its punctuation stranded.
-    text = re.sub(r"[ \t]+([,.!?;:])", r"\1", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text)
+    text = _EXCESS_NEWLINES_RE.sub("\n\n", text)
     return text.strip()
 
 
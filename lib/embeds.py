@@ -109,7 +109,7 @@ class EmbedBuilder:
                      who put the nomination forward.
         """
         display_title = vn_info.title_ja or vn_info.title_en or vn_info.vndb_id
-        vndb_link = await vn_info.get_vndb_link()
+        vndb_link = vn_info.vndb_link
 
         embed = create_base_embed(
             title=display_title,
@@ -146,7 +146,7 @@ class EmbedBuilder:
         if vote_count is not None:
             embed.add_field(name="Votes", value=str(vote_count), inline=True)
 
-        description = await vn_info.get_normalized_description(max_length=400)
+        description = vn_info.get_normalized_description(max_length=400)
         if description and description != "No description available.":
             embed.add_field(name="Description", value=description, inline=False)
 
@@ -189,7 +189,7 @@ class EmbedBuilder:
         Returns:
             Configured embed for VN information
         """
-        points_not_monthly = await vn_info.get_points_not_monthly()
+        points_not_monthly = vn_info.points_not_monthly
 
         display_title = vn_info.title_ja or vn_info.title_en or vn_info.vndb_id
         title = f"{title_prefix}{display_title}" if title_prefix else display_title
@@ -203,7 +203,7 @@ class EmbedBuilder:
         embed.add_field(name="Points (Monthly)", value=str(points), inline=True)
         embed.add_field(name="Points (Not Monthly)", value=str(points_not_monthly), inline=True)
 
-        description = await vn_info.get_normalized_description()
+        description = vn_info.get_normalized_description()
         embed.add_field(name="Description", value=description, inline=False)
         
         cover_url, cover_is_nsfw = resolve_display_cover(vn_info, jiten_data)
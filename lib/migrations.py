@@ -1057,8 +1057,8 @@ async def _add_vn_titles_nomination_dedup_index(bot) -> None:
     lands. The partial unique index — keyed on
     (nominator_user_id, guild_id, start_month, end_month) and scoped
     to status='nominated' — closes that window: the second INSERT OR
-    IGNORE no-ops and the cog handles the lastrowid=0 case as a race
-    duplicate.
+    IGNORE no-ops, its RETURNING yields no row, and the cog handles that
+    as a race duplicate.
 
     Scoped to status='nominated' so promoted winners
     (status='monthly'/'seasonal') don't collide with new nominations
@@ -1157,6 +1157,8 @@ async def _invalidate_vndb_cache_for_blur_threshold(bot) -> None:
     if cols:
         _log.info("Invalidating vndb_cache for new cover-blur threshold")
         await bot.RUN("DELETE FROM vndb_cache")
+        from lib.vndb_api import forget_vn_entry
+        forget_vn_entry()
     await bot.RUN(
         "INSERT OR IGNORE INTO migration_markers (name) VALUES (?)", (marker,)
     )
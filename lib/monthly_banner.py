@@ -863,7 +863,7 @@ async def render_banner_for_vn_entry(
     # ellipsize text that fits or truncate silently before it.
     description_clean: Optional[str] = None
     if jiten_data is None and vn_info.description:
-        description_clean = await vn_info.get_normalized_description(
+        description_clean = vn_info.get_normalized_description(
             max_length=None, plain=True,
         )
         if description_clean == "No description available.":
@@ -22,6 +22,10 @@ class BasePaginationView(discord.ui.View, ABC):
         self.per_page = per_page
         self.current_page = 0
         self.max_pages = self._calculate_max_pages()
+        # Rendered embeds by page index. Page content only depends on
+        # ``data`` and the page number, so flipping back to a page already
+        # seen is a dict lookup instead of a rebuild.
+        self._page_embeds: dict[int, discord.Embed] = {}
         
         # Update button states
         self._update_button_states()
@@ -36,6 +40,18 @@ class BasePaginationView(discord.ui.View, ABC):
     def create_embed(self) -> discord.Embed:
         """Create an embed for the current page - must be implemented by subclasses"""
         pass
+
+    def current_page_embed(self) -> discord.Embed:
+        """``create_embed`` for the current page, memoized per page index."""
+        embed = self._page_embeds.get(self.current_page)
+        if embed is None:
+            embed = self._page_embeds[self.current_page] = self.create_embed()
+        return embed
+
+    def _reset_page_cache(self) -> None:
+        """Drop memoized pages. Call after replacing ``data`` (or anything
+        else ``create_embed`` reads) in place."""
+        self._page_embeds.clear()
     
     def _update_button_states(self):
         """Update button enabled/disabled states based on current page"""
@@ -65,7 +81,7 @@ class BasePaginationView(discord.ui.View, ABC):
         fact."""
         try:
             await interaction.response.edit_message(
-                embed=self.create_embed(), view=self,
+                embed=self.current_page_embed(), view=self,
             )
         except Exception:
             _log.exception(
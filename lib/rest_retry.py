@@ -0,0 +1,75 @@
+# lib/rest_retry.py
+"""Retry wrapper for Discord REST calls made from background tasks.
+
+discord.py already retries 429s internally, but gives up (raising
+``HTTPException`` / ``RateLimited``) once its own retries or
+``max_ratelimit_timeout`` are exhausted. Unattended loops such as the
+role-reward tick and the DB backup post have nobody to re-run them, so
+they go through ``call_with_backoff`` to ride out a burst instead of
+silently dropping the call."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import discord
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Exponential fallback when Discord didn't say how long to wait.
+_BASE_BACKOFF_SECONDS = 1.0
+# Upper bound on the summed sleeps for one call. Past this the caller's
+# work is better retried on its next tick than held here.
+_MAX_TOTAL_WAIT_SECONDS = 60.0
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Seconds Discord asked us to wait, or None if this isn't a 429."""
+    if isinstance(exc, discord.RateLimited):
+        return exc.retry_after
+    if isinstance(exc, discord.HTTPException) and exc.status == 429:
+        header = getattr(exc.response, "headers", {}).get("Retry-After")
+        try:
+            return float(header) if header is not None else 0.0
+        except ValueError:
+            return 0.0
+    return None
+
+
+async def call_with_backoff(
+    factory: Callable[[], Awaitable[T]],
+    *,
+    max_retries: int = 5,
+    what: str = "discord call",
+) -> T:
+    """Await ``factory()``, retrying on rate limits.
+
+    ``factory`` must build a fresh awaitable per attempt (e.g.
+    ``lambda: member.edit(...)``) since a coroutine can only be awaited
+    once. Honors the returned ``retry_after`` plus a little jitter; falls
+    back to exponential backoff when none is given. Non-429 errors, and
+    429s past ``max_retries`` or the total-wait cap, propagate.
+    """
+    waited = 0.0
+    for attempt in range(max_retries + 1):
+        try:
+            return await factory()
+        except (discord.RateLimited, discord.HTTPException) as e:
+            retry_after = _retry_after(e)
+            if retry_after is None or attempt == max_retries:
+                raise
+            delay = retry_after or _BASE_BACKOFF_SECONDS * 2 ** attempt
+            delay += random.uniform(0, 0.5)
+            if waited + delay > _MAX_TOTAL_WAIT_SECONDS:
+                raise
+            _log.warning(
+                "%s rate-limited (attempt %d/%d); retrying in %.1fs",
+                what, attempt + 1, max_retries, delay,
+            )
+            waited += delay
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
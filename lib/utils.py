@@ -18,10 +18,14 @@ MAX_EMBED_DESCRIPTION = 4096
 MAX_EMBED_FIELD = 1024
 MAX_DISCORD_MESSAGE = 2000
 EMBED_DESCRIPTION_BUFFER = 100
+# Longest description we put in an embed, leaving the buffer above spare.
+EMBED_DESCRIPTION_LIMIT = MAX_EMBED_DESCRIPTION - EMBED_DESCRIPTION_BUFFER
 
 # Points and rating constants
 MIN_RATING = 1
 MAX_RATING = 5
+# Star strings indexed by rating, so rating lists don't build one per row.
+RATING_STARS = tuple("⭐" * i for i in range(MAX_RATING + 1))
 DEFAULT_MONTHLY_POINTS = 10
 NON_MONTHLY_MULTIPLIER = 0.6
 
@@ -52,10 +56,13 @@ DEFAULT_TIMEOUT = 300
 #                      command. Replaces the old global env lists
 #                      `VN_MANAGER_USER_IDS` / `VN_MANAGER_ROLE_IDS`,
 #                      which are no longer read.
-AUTHORIZED_USER_IDS = [
+#
+# Frozen set: every gated command does an `in` check against it, and the
+# env is only read once at import.
+AUTHORIZED_USER_IDS = frozenset(
     int(user_id) for user_id in os.getenv("AUTHORIZED_USERS", "").split(",")
     if user_id.strip()
-]
+)
 
 # ==================== UTILITY FUNCTIONS ====================
 
@@ -259,15 +266,16 @@ async def format_season_label_from_yyyy_mm(bot, yyyy_mm: str) -> str:
     return await format_season_label(bot, y, month_to_season_name(m))
 
 
+# Strict YYYY-MM with a real month number. ASCII digits only — ``\d``
+# would also accept non-ASCII digits, which strptime never did.
+_MONTH_FORMAT_RE = re.compile(r"[0-9]{4}-(?:0[1-9]|1[0-2])")
+
+
 def validate_month_format(month: str) -> bool:
     """Validate month format (YYYY-MM)."""
-    if not month or len(month) != 7:
-        return False
-    try:
-        datetime.strptime(month, "%Y-%m")
-        return True
-    except ValueError:
-        return False
+    # A compiled fullmatch instead of strptime: no datetime construction
+    # or exception round-trip for every validated input.
+    return bool(month) and _MONTH_FORMAT_RE.fullmatch(month) is not None
 
 
 def is_month_in_range(current_month: str, start_month: str, end_month: str) -> bool:
@@ -275,7 +283,9 @@ def is_month_in_range(current_month: str, start_month: str, end_month: str) -> b
     return start_month <= current_month <= end_month
 
 
-async def get_single_monthly_vn(bot, vndb_id: str, guild_id: int | None = None):
+async def get_single_monthly_vn(
+    bot, vndb_id: str, guild_id: int | None = None, *, current_month: str | None = None,
+):
     """Look up a vn_titles row for this VN that's *currently active*.
 
     "Active" = current month falls within [start_month, end_month]. When
@@ -287,6 +297,9 @@ async def get_single_monthly_vn(bot, vndb_id: str, guild_id: int | None = None):
 
     Returns a 4-tuple (vndb_id, start_month, end_month, is_monthly_points)
     matching ``DatabaseQueries.GET_VN_TITLE`` shape.
+
+    Callers that already computed ``get_current_month()`` for the same
+    command can pass it as ``current_month`` so both agree on "now".
     """
     if guild_id is not None:
         rows = await bot.GET(DatabaseQueries.GET_VN_TITLE_FOR_GUILD, (vndb_id, guild_id))
@@ -294,7 +307,7 @@ async def get_single_monthly_vn(bot, vndb_id: str, guild_id: int | None = None):
         rows = await bot.GET(DatabaseQueries.GET_VN_TITLE, (vndb_id,))
     if not rows:
         return None
-    current = get_current_month()
+    current = current_month or get_current_month()
     for row in rows:
         # row: (vndb_id, start_month, end_month, is_monthly_points)
         if row[1] <= current <= row[2]:
@@ -322,8 +335,7 @@ def format_points_display(current_points: int, new_points: int) -> str:
 
 def format_rating_display(rating: int) -> str:
     """Format rating display with stars."""
-    stars = "⭐" * rating
-    return f"**{rating}/5** {stars}"
+    return f"**{rating}/5** {RATING_STARS[rating]}"
 
 
 def create_vndb_link(vndb_id: str) -> str:
@@ -359,6 +371,13 @@ def split_text_for_discord(text: str, max_length: int = MAX_DISCORD_MESSAGE) ->
 # ==================== VN INPUT RESOLUTION ====================
 
 
+# Input shapes accepted by resolve_vn_from_input, compiled once.
+_RAW_VNDB_ID_RE = re.compile(r'v?(\d+)')
+_EMBEDDED_AUTOCOMPLETE_RE = re.compile(r'\$\{(?:[^|}]+\|)?v?(\d+):[^}]+\}')
+_BRACKETED_VNDB_ID_RE = re.compile(r'\[v(\d+)\]')
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
 async def resolve_vn_from_input(raw_value: str) -> str | None:
     """
     Resolve a VN ID from various input formats.
@@ -371,14 +390,20 @@ async def resolve_vn_from_input(raw_value: str) -> str | None:
     Returns:
         VNDB ID string (e.g., "v11") or None if not found
     """
-    # Import here to avoid circular imports
-    from lib.vndb_search import parse_autocomplete_value, search_visual_novel
-
     if not raw_value:
         return None
 
     raw_value = raw_value.strip()
 
+    # Fast path: a bare `v<digits>` / `<digits>` can't match any of the
+    # structured formats below, so skip them (and the deferred import).
+    raw_id_match = _RAW_VNDB_ID_RE.fullmatch(raw_value)
+    if raw_id_match:
+        return f"v{raw_id_match.group(1)}"
+
+    # Import here to avoid circular imports
+    from lib.vndb_search import parse_autocomplete_value, search_visual_novel
+
     # Try to parse as autocomplete value format first
     parsed = parse_autocomplete_value(raw_value)
     if parsed:
@@ -391,7 +416,7 @@ async def resolve_vn_from_input(raw_value: str) -> str | None:
     # can show up embedded in a garbled input string (e.g. Discord client
     # schema-cache hiccups). If we find one anywhere in the input, prefer
     # that over the looser fallbacks below.
-    embedded = re.search(r'\$\{(?:[^|}]+\|)?v?(\d+):[^}]+\}', raw_value)
+    embedded = _EMBEDDED_AUTOCOMPLETE_RE.search(raw_value)
     if embedded:
         return f"v{embedded.group(1)}"
 
@@ -399,7 +424,7 @@ async def resolve_vn_from_input(raw_value: str) -> str | None:
     # Format: "Title — YYYY-MM-DD • rating/10 [vXXXXX]"
 
     # First try to extract VN ID from [vXXXXX] pattern (most reliable)
-    vn_id_match = re.search(r'\[v(\d+)\]', raw_value)
+    vn_id_match = _BRACKETED_VNDB_ID_RE.search(raw_value)
     if vn_id_match:
         vndb_id = f"v{vn_id_match.group(1)}"
         _log.info(f"Recovered VN ID from display format: {vndb_id}")
@@ -408,7 +433,7 @@ async def resolve_vn_from_input(raw_value: str) -> str | None:
     # Fall back to title search for legacy autocomplete values without [vXXXXX]
     has_em_dash = " — " in raw_value
     has_badge_chars = "•" in raw_value or "/" in raw_value
-    has_date_pattern = bool(re.search(r'\d{4}-\d{2}-\d{2}', raw_value))
+    has_date_pattern = bool(_ISO_DATE_RE.search(raw_value))
     if has_em_dash and (has_badge_chars or has_date_pattern):
         # Extract the title part before the " — " separator
         title_part = raw_value.split(" — ")[0].strip()
@@ -428,15 +453,9 @@ async def resolve_vn_from_input(raw_value: str) -> str | None:
             except Exception as e:
                 _log.warning(f"Failed to recover VN from display format: {e}")
 
-    # Treat as raw VNDB ID — but only if it actually looks like one. The
-    # earlier branches handled every "structured" input we know about;
-    # anything that gets here should be either `v<digits>` or bare digits.
-    # Without this validation the fallback would rubber-stamp arbitrary
-    # text and send it to the VNDB API as a malformed ID.
-    raw_id_match = re.fullmatch(r'v?(\d+)', raw_value)
-    if raw_id_match:
-        return f"v{raw_id_match.group(1)}"
-
+    # Raw VNDB IDs were handled up front. Anything else is unrecognized —
+    # don't rubber-stamp arbitrary text and send it to the VNDB API as a
+    # malformed ID.
     _log.warning("resolve_vn_from_input: unrecognized input %r", raw_value)
     return None
 
@@ -633,7 +652,7 @@ async def is_manager(interaction: discord.Interaction) -> bool:
     return await _requester_is_manager(interaction)
 
 
-async def validate_month_input(interaction: discord.Interaction, month: str = None) -> str:
+def validate_month_input(interaction: discord.Interaction, month: str = None) -> str:
     """
     Validate and return month string.
     
@@ -659,7 +678,7 @@ async def validate_month_input(interaction: discord.Interaction, month: str = No
     return month
 
 
-async def validate_rating_input(rating: int) -> int:
+def validate_rating_input(rating: int) -> int:
     """
     Validate rating input.
     
@@ -705,7 +724,7 @@ def create_base_embed(
     embed = discord.Embed(title=title, color=color)
     
     if description:
-        embed.description = truncate_text(description, MAX_EMBED_DESCRIPTION - EMBED_DESCRIPTION_BUFFER)
+        embed.description = truncate_text(description, EMBED_DESCRIPTION_LIMIT)
     
     if author_name:
         embed.set_author(name=author_name, icon_url=author_icon)
@@ -803,6 +822,56 @@ class DatabaseQueries:
         "ON reading_logs (user_id, vndb_id, reward_month) WHERE vndb_id IS NOT NULL",
     )
 
+    # Per-user running SUM(points) over reading_logs, kept current by the
+    # triggers below so the 5-minute role-reward tick reads one row per
+    # user instead of re-aggregating the whole log table. The cog rebuilds
+    # the totals from reading_logs on every startup (REBUILD_USER_POINTS_TOTALS),
+    # which both backfills legacy databases and heals any drift from writes
+    # made with the triggers absent (e.g. a restored backup).
+    CREATE_USER_POINTS_TOTALS = (
+        """
+        CREATE TABLE IF NOT EXISTS user_points_totals (
+            user_id INTEGER PRIMARY KEY,
+            total_points INTEGER NOT NULL DEFAULT 0
+        );""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_reading_logs_points_ai
+        AFTER INSERT ON reading_logs
+        BEGIN
+            INSERT INTO user_points_totals (user_id, total_points)
+            VALUES (NEW.user_id, NEW.points)
+            ON CONFLICT(user_id) DO UPDATE SET
+                total_points = total_points + excluded.total_points;
+        END;""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_reading_logs_points_ad
+        AFTER DELETE ON reading_logs
+        BEGIN
+            UPDATE user_points_totals SET total_points = total_points - OLD.points
+            WHERE user_id = OLD.user_id;
+        END;""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_reading_logs_points_au
+        AFTER UPDATE OF user_id, points ON reading_logs
+        BEGIN
+            UPDATE user_points_totals SET total_points = total_points - OLD.points
+            WHERE user_id = OLD.user_id;
+            INSERT INTO user_points_totals (user_id, total_points)
+            VALUES (NEW.user_id, NEW.points)
+            ON CONFLICT(user_id) DO UPDATE SET
+                total_points = total_points + excluded.total_points;
+        END;""",
+    )
+
+    REBUILD_USER_POINTS_TOTALS = (
+        ("DELETE FROM user_points_totals;", ()),
+        (
+            "INSERT INTO user_points_totals (user_id, total_points) "
+            "SELECT user_id, SUM(points) FROM reading_logs GROUP BY user_id;",
+            (),
+        ),
+    )
+
     ADD_READING_LOG = """
     INSERT INTO reading_logs (user_id, vndb_id, user_rating, reward_reason, reward_month, points, comment, logged_in_guild, completed_at)
     VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP);
@@ -811,13 +880,15 @@ class DatabaseQueries:
     # Race-safe INSERT for the /finish and /manage_log paths. Pairs with
     # the partial unique index on (user_id, vndb_id, reward_month) above:
     # two concurrent inserts for the same key resolve to one row
-    # silently. RUN_RETURNING_ID's lastrowid is 0 on the ignored case
-    # (no row inserted), which the caller checks to surface an
-    # "already logged" message instead of pretending the insert
-    # happened.
+    # silently. RETURNING yields no row on the ignored case, which the
+    # caller checks to surface an "already logged" message instead of
+    # pretending the insert happened. (lastrowid can't be used for this:
+    # on the shared writer connection it still holds the previous
+    # insert's id.)
     ADD_READING_LOG_OR_IGNORE = """
     INSERT OR IGNORE INTO reading_logs (user_id, vndb_id, user_rating, reward_reason, reward_month, points, comment, logged_in_guild, completed_at)
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP);
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    RETURNING log_id;
     """
     
     GET_USER_VN_LOG = """
@@ -840,46 +911,66 @@ class DatabaseQueries:
     FROM reading_logs WHERE log_id = ?;
     """
     
+    # One primary-key row from the trigger-maintained totals (see
+    # CREATE_USER_POINTS_TOTALS) instead of summing every log the user has.
     GET_USER_TOTAL_POINTS = """
-    SELECT SUM(points) FROM reading_logs WHERE user_id = ?;
+    SELECT total_points FROM user_points_totals WHERE user_id = ?;
     """
     
-    GET_USER_LOGS = """
-    SELECT log_id, user_id, vndb_id, user_rating, reward_reason, reward_month, points, comment, logged_in_guild
-    FROM reading_logs WHERE user_id = ? ORDER BY reward_month DESC, log_id DESC;
-    """
-    
-    GET_ALL_LOGS = """
-    SELECT user_id, vndb_id, reward_reason, reward_month, points, comment, logged_in_guild 
-    FROM reading_logs ORDER BY reward_month DESC;
-    """
-    
-    GET_LOGS_BY_MONTH = """
-    SELECT user_id, vndb_id, reward_reason, reward_month, points, comment, logged_in_guild 
-    FROM reading_logs WHERE reward_month = ? ORDER BY reward_month DESC;
+    # One /logs page: params are (user_id, limit, offset). Titles come from
+    # vndb_cache in the same pass; the trailing `cached` flag is 0 when the
+    # VN has no cache row yet, so the cog only goes to from_vndb_ids for
+    # those. The log_id tiebreak keeps page boundaries stable within a
+    # month, and idx_reading_logs_user_month serves the seek.
+    GET_USER_LOGS_PAGE = """
+    SELECT rl.log_id, rl.user_id, rl.vndb_id, rl.user_rating, rl.reward_reason,
+           rl.reward_month, rl.points, rl.comment, rl.logged_in_guild,
+           vc.title_ja, vc.title_en, vc.vndb_id IS NOT NULL AS cached
+    FROM reading_logs rl
+    LEFT JOIN vndb_cache vc ON vc.vndb_id = rl.vndb_id
+    WHERE rl.user_id = ? ORDER BY rl.reward_month DESC, rl.log_id DESC
+    LIMIT ? OFFSET ?;
     """
-    
-    GET_LOGS_BY_SERVER = """
-    SELECT user_id, vndb_id, reward_reason, reward_month, points, comment, logged_in_guild 
-    FROM reading_logs WHERE logged_in_guild = ? ORDER BY reward_month DESC;
+
+    COUNT_USER_LOGS = """
+    SELECT COUNT(*) FROM reading_logs WHERE user_id = ?;
     """
     
-    GET_LOGS_BY_MONTH_AND_SERVER = """
-    SELECT user_id, vndb_id, reward_reason, reward_month, points, comment, logged_in_guild
-    FROM reading_logs WHERE reward_month = ? AND logged_in_guild = ? ORDER BY reward_month DESC;
-    """
-
+    # Leaderboard aggregates: one row per user, (user_id, points,
+    # completions), already ranked. Completions count logs tied to a VN;
+    # points-only rewards add points but not completions. Ties keep the
+    # lower user_id first so the order is stable across re-renders.
+    _LEADERBOARD_SELECT = """
+    SELECT user_id, SUM(points) AS pts, COUNT(NULLIF(vndb_id, '')) AS completions
+    FROM reading_logs {where}
+    GROUP BY user_id ORDER BY pts DESC, completions DESC, user_id;
+    """
+    GET_LEADERBOARD_ALL = _LEADERBOARD_SELECT.format(where="")
+    GET_LEADERBOARD_BY_MONTH = _LEADERBOARD_SELECT.format(
+        where="WHERE reward_month = ?")
+    GET_LEADERBOARD_BY_SERVER = _LEADERBOARD_SELECT.format(
+        where="WHERE logged_in_guild = ?")
+    GET_LEADERBOARD_BY_MONTH_AND_SERVER = _LEADERBOARD_SELECT.format(
+        where="WHERE reward_month = ? AND logged_in_guild = ?")
     # Season filters span 3 months; see season_to_months() for the YYYY-MM list.
-    GET_LOGS_BY_SEASON = """
-    SELECT user_id, vndb_id, reward_reason, reward_month, points, comment, logged_in_guild
-    FROM reading_logs WHERE reward_month IN (?, ?, ?) ORDER BY reward_month DESC;
-    """
+    GET_LEADERBOARD_BY_SEASON = _LEADERBOARD_SELECT.format(
+        where="WHERE reward_month IN (?, ?, ?)")
+    GET_LEADERBOARD_BY_SEASON_AND_SERVER = _LEADERBOARD_SELECT.format(
+        where="WHERE reward_month IN (?, ?, ?) AND logged_in_guild = ?")
+
+    # Server standings: per-(guild, user) point sums. Rows with a NULL
+    # logged_in_guild come back as their own group; the cog skips them.
+    _SERVER_STANDINGS_SELECT = """
+    SELECT logged_in_guild, user_id, SUM(points) AS pts
+    FROM reading_logs {where}
+    GROUP BY logged_in_guild, user_id;
+    """
+    GET_SERVER_STANDINGS_ALL = _SERVER_STANDINGS_SELECT.format(where="")
+    GET_SERVER_STANDINGS_BY_MONTH = _SERVER_STANDINGS_SELECT.format(
+        where="WHERE reward_month = ?")
+    GET_SERVER_STANDINGS_BY_SEASON = _SERVER_STANDINGS_SELECT.format(
+        where="WHERE reward_month IN (?, ?, ?)")
 
-    GET_LOGS_BY_SEASON_AND_SERVER = """
-    SELECT user_id, vndb_id, reward_reason, reward_month, points, comment, logged_in_guild
-    FROM reading_logs WHERE reward_month IN (?, ?, ?) AND logged_in_guild = ? ORDER BY reward_month DESC;
-    """
-    
     REWARD_USER_POINTS = """
     INSERT INTO reading_logs (user_id, reward_reason, reward_month, points, logged_in_guild)
     VALUES (?, ?, ?, ?, ?);
@@ -906,6 +997,12 @@ class DatabaseQueries:
     WHERE vndb_id = ? AND user_rating IS NOT NULL
     ORDER BY user_rating DESC, user_id, reward_month DESC;
     """
+
+    GET_VN_RATING_STATS = """
+    SELECT AVG(CAST(user_rating AS REAL)) as avg_rating, COUNT(user_rating) as rating_count
+    FROM reading_logs
+    WHERE vndb_id = ? AND user_rating IS NOT NULL;
+    """
     
     GET_USER_AVERAGE_RATING = """
     SELECT AVG(CAST(user_rating AS REAL)) as avg_rating, COUNT(user_rating) as rating_count
@@ -959,14 +1056,21 @@ class DatabaseQueries:
     # work and large pools without a LIMIT will simply blow the
     # deadline. Filtering + LIMIT 25 at the SQL layer keeps the
     # autocomplete callback fast regardless of pool size.
+    #
+    # VN_AUTOCOMPLETE is the exception: it returns the whole pool, one row
+    # per VN (most recently added first), because lib.autocomplete caches
+    # it and filters per keystroke in memory. A LIMIT here would hide
+    # every VN past the first 25 from the filter.
     VN_AUTOCOMPLETE = """
     SELECT vn.vndb_id, vndb.title_ja
     FROM vn_titles vn
     INNER JOIN vndb_cache vndb ON vndb.vndb_id = vn.vndb_id
-    LIMIT 25
+    GROUP BY vn.vndb_id
+    ORDER BY MAX(vn.id) DESC
     """
 
-    # Same shape as VN_AUTOCOMPLETE but filtered to a single user. The
+    # One user's latest logs, projected to just what the choice label
+    # shows; non-VN logs fall back to their reward_reason as the name. The
     # join on vc.vndb_id used to have an OR-branch matching
     # 'v' || rl.vndb_id for legacy rows that stored the id without the
     # 'v' prefix; the bot has been normalizing IDs to v-prefixed for
@@ -974,8 +1078,9 @@ class DatabaseQueries:
     # vndb_cache PK index by making the join non-sargable). LIMIT 25
     # mirrors Discord's choice cap.
     USER_LOGS_AUTOCOMPLETE = """
-    SELECT rl.log_id, rl.vndb_id, rl.reward_month, rl.reward_reason, rl.points,
-           COALESCE(vc.title_ja, vc.title_en) as vn_title
+    SELECT rl.log_id, rl.reward_month, rl.points,
+           COALESCE(NULLIF(vc.title_ja, ''), NULLIF(vc.title_en, ''),
+                    NULLIF(rl.reward_reason, ''), 'Unknown') as display_name
     FROM reading_logs rl
     LEFT JOIN vndb_cache vc ON vc.vndb_id = rl.vndb_id
     WHERE rl.user_id = ?
@@ -1393,10 +1498,6 @@ class DatabaseQueries:
     # Per-guild vn_titles queries (legacy ADD_VN_TITLE / GET_CURRENT_MONTHLY_VNS
     # remain for backwards compat — they treat all rows as global and ignore
     # guild_id, which is correct for legacy NULL-guild rows.)
-    ADD_VN_TITLE_FOR_GUILD = """
-    INSERT INTO vn_titles (vndb_id, guild_id, start_month, end_month, is_monthly_points, status)
-    VALUES (?, ?, ?, ?, ?, ?);
-    """
 
     # Whitelist of vn_titles columns that `/manage_pool action:edit` will
     # change. The cog assembles a `SET col = ?` clause from the subset the
@@ -1462,6 +1563,33 @@ class DatabaseQueries:
     ORDER BY start_month;
     """
 
+    # VNs on current or upcoming pool entries, across all guilds. Used to
+    # warm the in-process VN_Entry cache on startup. Bind: (current_month,).
+    GET_ACTIVE_POOL_VNDB_IDS = """
+    SELECT DISTINCT vndb_id FROM vn_titles
+    WHERE vndb_id IS NOT NULL AND end_month >= ?;
+    """
+
+    # `/manage_pool action:add` in one statement: insert only when
+    # GET_OVERLAPPING_POOL_ENTRIES would come back empty, and hand back the
+    # new id. Numbered binds so the overlap probe reuses the insert values:
+    # (vndb_id, guild_id, start_month, end_month, is_monthly_points, status).
+    # Zero rows back means an overlap blocked it — the caller re-reads with
+    # GET_OVERLAPPING_POOL_ENTRIES for the error message.
+    ADD_VN_TITLE_FOR_GUILD_IF_NO_OVERLAP = """
+    INSERT INTO vn_titles (vndb_id, guild_id, start_month, end_month, is_monthly_points, status)
+    SELECT ?1, ?2, ?3, ?4, ?5, ?6
+    WHERE NOT EXISTS (
+        SELECT 1 FROM vn_titles
+        WHERE vndb_id = ?1
+          AND (?2 IS NULL OR guild_id IS NULL OR guild_id = ?2)
+          AND start_month <= ?4
+          AND end_month >= ?3
+          AND status IN ('monthly', 'seasonal', 'special')
+    )
+    RETURNING id;
+    """
+
     DELETE_VN_TITLE_FOR_GUILD = """
     DELETE FROM vn_titles WHERE vndb_id = ? AND (guild_id IS NULL OR guild_id = ?);
     """
@@ -1480,21 +1608,22 @@ class DatabaseQueries:
     WHERE id = ?;
     """
 
-    # Bind: (pool_id, observed_guild_id). The observed_guild_id is the
-    # row's `guild_id` AS READ by the caller — including NULL for
-    # legacy/global rows. SQLite's `IS` operator is NULL-safe equality:
-    # `guild_id IS ?` matches when both are NULL, both are the same
-    # number, or neither. This closes the TOCTOU between the GET-row
-    # and the DELETE — if another process moved the row's guild_id
-    # between read and write, the DELETE hits zero rows and the cog
-    # tells the admin instead of silently mutating the relocated row.
-    DELETE_VN_TITLE_BY_ID = """
-    DELETE FROM vn_titles WHERE id = ? AND guild_id IS ?;
+    # Single-round-trip form of the /manage_pool remove path: the scope
+    # check from require_same_guild is folded into the WHERE so the common
+    # case is one statement, and RETURNING hands back what was deleted for
+    # the confirmation message. Bind: (pool_id, requester_guild_id,
+    # is_operator). Legacy/global rows (guild_id NULL) are in scope for any
+    # guild; operators (is_operator = 1) are unscoped. Zero rows back means
+    # missing, out of scope, or raced — the caller re-reads to tell which.
+    DELETE_VN_TITLE_IN_SCOPE_RETURNING = """
+    DELETE FROM vn_titles
+    WHERE id = ? AND (guild_id IS NULL OR guild_id = ? OR ?)
+    RETURNING id, vndb_id, guild_id, start_month, end_month, is_monthly_points, status;
     """
 
     # Full pool entries for a guild, joined with VNDB cache for the title.
     # Used by /pool listing and the ID-aware autocomplete on /manage_pool.
-    # Trailing column is `status` so VNListView can show a kind badge.
+    # Trailing column is `status` so the listing can show a kind badge.
     GET_POOL_ENTRIES_FOR_GUILD = """
     SELECT vn.id, vn.vndb_id, vn.guild_id, vn.start_month, vn.end_month,
            vn.is_monthly_points, vn.created_at, vc.title_ja, vc.title_en, vn.status
@@ -1526,13 +1655,16 @@ class DatabaseQueries:
     # (nominator_user_id, guild_id, start_month, end_month) WHERE
     # status='nominated' closes the TOCTOU race between the cog's
     # SELECT-then-decide guard and this insert: a duplicate concurrent
-    # /nominate no-ops silently and the caller checks lastrowid=0 to
-    # surface a "race resolved" path.
+    # /nominate no-ops silently and RETURNING yields no row, which the
+    # caller surfaces as a "race resolved" path. (lastrowid can't signal
+    # this: on the shared writer connection an ignored insert leaves it
+    # at the previous insert's id.)
     INSERT_NOMINATION_AS_PICK = """
     INSERT OR IGNORE INTO vn_titles
         (vndb_id, guild_id, start_month, end_month, is_monthly_points,
          status, cycle_id, nominator_user_id, title_cache)
-    VALUES (?, ?, ?, ?, ?, 'nominated', ?, ?, ?);
+    VALUES (?, ?, ?, ?, ?, 'nominated', ?, ?, ?)
+    RETURNING id;
     """
 
     # Find any active voting cycle of the SAME KIND whose target window
@@ -5,8 +5,10 @@ from .desciption_processing import replace_bbcode, to_plain_text
 from .utils import smart_truncate
 import aiohttp
 import asyncio
+import heapq
 import logging
 import time
+from collections import OrderedDict
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
@@ -34,6 +36,19 @@ _vndb_extras_locks: dict[str, asyncio.Lock] = {}
 _theme_attrs_cache: dict[str, tuple[float, dict]] = {}
 _theme_attrs_locks: dict[str, asyncio.Lock] = {}
 
+# Process-local LRU in front of vndb_cache for resolved VN_Entry objects.
+# /pool pages, /logs and banner renders resolve the same handful of ids over
+# and over; a hit here skips the SQLite round-trip entirely. vndb_cache rows
+# are write-once (character_count isn't part of VN_Entry), so the TTL only
+# bounds staleness after an out-of-band cache wipe.
+_VN_ENTRY_TTL_SECONDS = 3600
+_VN_ENTRY_CACHE_CAP = 1024
+_vn_entry_cache: "OrderedDict[str, tuple[float, VN_Entry]]" = OrderedDict()
+# One lock per id with a VNDB fetch in flight, so concurrent misses for the
+# same VN (a /finish racing the pool prewarm, two /logs pages) share one
+# API call. Dropped once the fetch settles.
+_vn_fetch_locks: dict[str, asyncio.Lock] = {}
+
 CREATE_VNDB_CACHE_TABLE = """
 CREATE TABLE IF NOT EXISTS vndb_cache (
     vndb_id TEXT PRIMARY KEY,
@@ -59,6 +74,18 @@ SELECT vndb_id, title_en, title_ja, thumbnail_url, thumbnail_is_nsfw, length_min
 FROM vndb_cache WHERE vndb_id = ?;
 """
 
+# Bulk variant for list renders; ``{placeholders}`` is filled with one "?"
+# per id by from_vndb_ids. Chunked so a huge id list can't exceed SQLite's
+# bound-parameter limit (999 on older builds).
+GET_VNDB_ENTRIES_QUERY = """
+SELECT vndb_id, title_en, title_ja, thumbnail_url, thumbnail_is_nsfw, length_minutes, length_rating, description
+FROM vndb_cache WHERE vndb_id IN ({placeholders});
+"""
+_VNDB_BULK_QUERY_CHUNK = 500
+# Cold-cache misses in a bulk lookup hit the VNDB API, which rate-limits
+# per IP across every guild; keep the fan-out modest.
+_VNDB_BULK_FETCH_CONCURRENCY = 10
+
 # Used by /finish + /club_stats lazy backfill: store the jiten character count
 # alongside the VNDB metadata so club-wide chars/sums are a pure SQL aggregate
 # instead of N jiten round-trips per query.
@@ -134,7 +161,10 @@ class VN_Entry:
         except Exception as e:  # noqa: BLE001
             _log.debug("set_cached_character_count failed for %s: %s", vndb_id, e)
 
-    async def get_points_not_monthly(self) -> int:
+    # Pure derivations of the cached fields — plain properties/methods so
+    # embed builders don't pay a coroutine per accessor.
+    @property
+    def points_not_monthly(self) -> int:
         if self.length_minutes:
             reading_hours = round(self.length_minutes / 600) * 10
             points = (reading_hours // 10) + 1
@@ -143,10 +173,11 @@ class VN_Entry:
             return int(self.length_rating)
         return 1
 
-    async def get_vndb_link(self) -> str:
+    @property
+    def vndb_link(self) -> str:
         return f"https://vndb.org/{self.vndb_id}"
 
-    async def get_normalized_description(
+    def get_normalized_description(
         self, max_length: Optional[int] = 1000, *, plain: bool = False,
     ) -> str:
         """Get a normalized description for the VN.
@@ -254,20 +285,125 @@ class VN_Entry:
         )
 
 
+def _memo_get(vndb_id: str) -> Optional[VN_Entry]:
+    cached = _vn_entry_cache.get(vndb_id)
+    if cached is None:
+        return None
+    if (time.monotonic() - cached[0]) >= _VN_ENTRY_TTL_SECONDS:
+        _vn_entry_cache.pop(vndb_id, None)
+        return None
+    _vn_entry_cache.move_to_end(vndb_id)
+    return cached[1]
+
+
+def _memo_put(entry: VN_Entry) -> VN_Entry:
+    _vn_entry_cache[entry.vndb_id] = (time.monotonic(), entry)
+    _vn_entry_cache.move_to_end(entry.vndb_id)
+    while len(_vn_entry_cache) > _VN_ENTRY_CACHE_CAP:
+        _vn_entry_cache.popitem(last=False)
+    return entry
+
+
+def forget_vn_entry(vndb_id: Optional[str] = None) -> None:
+    """Drop one id (or everything) from the in-process VN_Entry cache.
+
+    Call after rewriting or deleting vndb_cache rows outside of
+    ``save_to_db`` so the next lookup goes back to SQLite.
+    """
+    if vndb_id is None:
+        _vn_entry_cache.clear()
+        return
+    if not vndb_id.startswith("v"):
+        vndb_id = f"v{vndb_id}"
+    _vn_entry_cache.pop(vndb_id, None)
+
+
+async def _fetch_and_cache(bot: VNClubBot, vndb_id: str) -> Optional[VN_Entry]:
+    """Cache-miss path: pull ``vndb_id`` from the VNDB API and persist it.
+
+    Callers queued behind an in-flight fetch for the same id pick up its
+    result from the memo instead of fetching again.
+    """
+    lock = _vn_fetch_locks.get(vndb_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _vn_fetch_locks[vndb_id] = lock
+
+    async with lock:
+        try:
+            entry = _memo_get(vndb_id)
+            if entry is not None:
+                return entry
+            vn_info = await VN_Entry._fetch_from_vndb(vndb_id)
+            if not vn_info:
+                _log.error(f"Failed to fetch VNDB info for ID {vndb_id}.")
+                return None
+            entry = VN_Entry(*vn_info)
+            await VN_Entry.save_to_db(bot, entry)
+            return _memo_put(entry)
+        finally:
+            if _vn_fetch_locks.get(vndb_id) is lock:
+                del _vn_fetch_locks[vndb_id]
+
+
 async def from_vndb_id(bot: VNClubBot, vndb_id: str) -> Optional[VN_Entry]:
-    """Fetch or create VN_Entry from DB or VNDB API."""
+    """Fetch or create VN_Entry from memory, DB, or the VNDB API."""
     if not vndb_id.startswith("v"):
         vndb_id = f"v{vndb_id}"
+    entry = _memo_get(vndb_id)
+    if entry is not None:
+        return entry
     vn_info = await VN_Entry._get_from_db(bot, vndb_id)
     if not vn_info:
-        vn_info = await VN_Entry._fetch_from_vndb(vndb_id)
-        if not vn_info:
-            _log.error(f"Failed to fetch VNDB info for ID {vndb_id}.")
-            return None
-        entry = VN_Entry(*vn_info)
-        await VN_Entry.save_to_db(bot, entry)
-        return entry
-    return VN_Entry(*vn_info)
+        return await _fetch_and_cache(bot, vndb_id)
+    return _memo_put(VN_Entry(*vn_info))
+
+
+async def from_vndb_ids(bot: VNClubBot, vndb_ids) -> dict[str, VN_Entry]:
+    """Bulk form of ``from_vndb_id`` for list renders.
+
+    Ids already in the in-process cache skip SQLite; the rest come back
+    from a single ``IN (...)`` query instead of one SELECT per id. Only
+    the misses fan out to the VNDB API, bounded by
+    ``_VNDB_BULK_FETCH_CONCURRENCY``. Keys are the normalized v-prefixed
+    ids; ids that failed to resolve are simply absent from the result.
+    """
+    ids = list(dict.fromkeys(
+        v if v.startswith("v") else f"v{v}" for v in vndb_ids if v
+    ))
+    found: dict[str, VN_Entry] = {}
+    for v in ids:
+        entry = _memo_get(v)
+        if entry is not None:
+            found[v] = entry
+    unseen = [v for v in ids if v not in found]
+    for start in range(0, len(unseen), _VNDB_BULK_QUERY_CHUNK):
+        chunk = unseen[start:start + _VNDB_BULK_QUERY_CHUNK]
+        rows = await bot.GET(
+            GET_VNDB_ENTRIES_QUERY.format(placeholders=",".join("?" * len(chunk))),
+            tuple(chunk),
+        )
+        for row in rows:
+            found[row[0]] = _memo_put(VN_Entry(*row))
+
+    missing = [v for v in ids if v not in found]
+    if missing:
+        _log.info("VNDB bulk lookup: %d cached, %d to fetch", len(found), len(missing))
+        sem = asyncio.Semaphore(_VNDB_BULK_FETCH_CONCURRENCY)
+
+        async def _one(vndb_id: str) -> Optional[VN_Entry]:
+            async with sem:
+                return await _fetch_and_cache(bot, vndb_id)
+
+        fetched = await asyncio.gather(
+            *(_one(v) for v in missing), return_exceptions=True,
+        )
+        for vndb_id, entry in zip(missing, fetched):
+            if isinstance(entry, Exception):
+                _log.warning("VNDB lookup failed for %s: %s", vndb_id, entry)
+            elif entry is not None:
+                found[vndb_id] = entry
+    return found
 
 
 # Display labels for VNDB's `platforms` short codes. Common platforms
@@ -446,14 +582,15 @@ async def fetch_vndb_extras(
     # tags). Both are sorted by rating and capped at 5.
     raw_tags = vn.get("tags") or []
     def _by_category(cat: str) -> list[str]:
-        filtered = [
-            t for t in raw_tags
-            if t.get("category") == cat
-            and (t.get("spoiler") or 0) == 0
-            and t.get("name")
-        ]
-        filtered.sort(key=lambda t: t.get("rating") or 0, reverse=True)
-        return [t["name"] for t in filtered[:5]]
+        top = heapq.nlargest(
+            5,
+            (t for t in raw_tags
+             if t.get("category") == cat
+             and (t.get("spoiler") or 0) == 0
+             and t.get("name")),
+            key=lambda t: t.get("rating") or 0,
+        )
+        return [t["name"] for t in top]
 
     top_tags = _by_category("cont") or _by_category("tech")
 
@@ -0,0 +1,53 @@
+"""Run the reading_logs insert against the real schema, triggers included."""
+
+import sqlite3
+import unittest
+
+from lib.utils import DatabaseQueries
+
+
+class AddReadingLogOrIgnoreTest(unittest.TestCase):
+    def setUp(self):
+        self.db = sqlite3.connect(":memory:")
+        self.db.execute(DatabaseQueries.CREATE_READING_LOGS_TABLE)
+        for stmt in DatabaseQueries.CREATE_READING_LOGS_INDEXES:
+            self.db.execute(stmt)
+        for stmt in DatabaseQueries.CREATE_USER_POINTS_TOTALS:
+            self.db.execute(stmt)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _insert(self, points=5):
+        return self.db.execute(
+            DatabaseQueries.ADD_READING_LOG_OR_IGNORE,
+            (42, "v17", 8, "Finished VN", "2026-10", points, None, 1),
+        ).fetchall()
+
+    def _total(self):
+        row = self.db.execute(
+            "SELECT total_points FROM user_points_totals WHERE user_id = 42"
+        ).fetchone()
+        return row[0] if row else None
+
+    def test_insert_returns_log_id_and_updates_totals(self):
+        inserted = self._insert()
+        self.assertEqual(len(inserted), 1)
+        (log_id,) = inserted[0]
+        row = self.db.execute(
+            "SELECT user_id, vndb_id, points FROM reading_logs WHERE log_id = ?",
+            (log_id,),
+        ).fetchone()
+        self.assertEqual(row, (42, "v17", 5))
+        self.assertEqual(self._total(), 5)
+
+    def test_duplicate_in_same_month_is_ignored(self):
+        self._insert()
+        self.assertEqual(self._insert(points=7), [])
+        count = self.db.execute("SELECT COUNT(*) FROM reading_logs").fetchone()[0]
+        self.assertEqual(count, 1)
+        self.assertEqual(self._total(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()